@@ -0,0 +1,80 @@
+"""
+Compares :class:`adorable.writer.DowngradingStream` with
+decoding a log, replacing escape sequences with
+``adorable.measure.ANSI_PATTERN`` and encoding it again.
+
+The log is written in chunks of 64 KiB, once to a colorless
+sink and once to an 8bit terminal.
+
+Run from the repository root::
+
+    python benchmarks/bench_downgrade.py
+"""
+
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from adorable.measure import ANSI_PATTERN  # noqa: E402
+from adorable.term import Terminal  # noqa: E402
+from adorable.writer import DowngradingStream  # noqa: E402
+
+NUMBER = 5
+CHUNK = 1 << 16
+
+LOGS = {
+    "plain": b"".join(
+        b"2025-06-19 12:00:00 INFO request %d served in 0.42ms\n" % i
+        for i in range(100_000)
+    ),
+    "styled": b"".join(
+        b"\x1b[2m2025-06-19 12:00:00\x1b[0m \x1b[38;2;80;200;120mINFO\x1b[0m "
+        b"request %d served in \x1b[1m0.42ms\x1b[0m\n" % i
+        for i in range(100_000)
+    ),
+}
+
+
+def chunks(data):
+    return [data[i : i + CHUNK] for i in range(0, len(data), CHUNK)]
+
+
+def regex(log, replace) -> None:
+    sink = io.BytesIO()
+    for chunk in chunks(log):
+        sink.write(ANSI_PATTERN.sub(replace, chunk.decode()).encode())
+
+
+def stream(log, target) -> None:
+    sink = io.BytesIO()
+    writer = DowngradingStream(sink, target)
+    for chunk in chunks(log):
+        writer.write(chunk)
+    writer.close()
+
+
+def downgrade_8bit(match) -> str:
+    # the least work a str based rewrite has to do per sequence
+    return match.group()
+
+
+def main() -> None:
+    for name, log in LOGS.items():
+        for target, replace in (
+            (Terminal.NOCOLOR, ""),
+            (Terminal.BIT8, downgrade_8bit),
+        ):
+            slow = min(timeit.repeat(lambda: regex(log, replace), number=NUMBER, repeat=3))
+            fast = min(timeit.repeat(lambda: stream(log, target), number=NUMBER, repeat=3))
+            mb = len(log) * NUMBER / fast / 1e6
+            print(
+                f"{name:<7} {target.name:<8} {slow / fast:5.1f}x faster than "
+                f"str regex ({mb:7.0f} MB/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
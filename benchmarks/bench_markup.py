@@ -0,0 +1,98 @@
+"""
+Compares XML markup with bracket markup and with
+compiled XML templates.
+
+Each input is styled once as the same string over and
+over (e.g. a constant message) and once as a different
+string each time (e.g. a formatted log line).
+
+Run from the repository root::
+
+    python benchmarks/bench_markup.py
+"""
+
+import os
+import sys
+import timeit
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import adorable  # noqa: E402
+from adorable import color  # noqa: E402
+
+NUMBER = 20_000
+
+warnings.simplefilter("ignore", PendingDeprecationWarning)
+adorable.use("BIT8")
+STYLE = {
+    "red": color.from_name("red").fg,
+    "green": color.from_name("green").fg,
+    "bold": adorable.BOLD,
+}
+
+INPUTS = {
+    "short": (
+        "<red>error</red>: file {} not found",
+        "[red]error[/red]: file {} not found",
+    ),
+    "nested": (
+        "<bold>GET <green>/index.html</green> <red>404</red></bold> {}ms",
+        "[bold]GET [green]/index.html[/] [red]404[/][/bold] {}ms",
+    ),
+    "long": (
+        " ".join(f"<green>{i}</green> &lt;{{0}}&gt;" for i in range(50)),
+        " ".join(f"[green]{i}[/] <{{0}}>" for i in range(50)),
+    ),
+}
+
+
+def measure(function, strings) -> float:
+    """
+    Returns the time per call in microseconds.
+    """
+    best = float("inf")
+    for _ in range(5):
+        values = iter(strings)
+        seconds = timeit.timeit(lambda: function(next(values)), number=NUMBER)
+        best = min(best, seconds)
+
+    return best / NUMBER * 1e6
+
+
+def main() -> None:
+    def xml(string):
+        return adorable.markup_xml(string, dict(STYLE))
+
+    def brackets(string):
+        return adorable.markup_brackets(string, STYLE)
+
+    for name, (xml_template, brackets_template) in INPUTS.items():
+        for kind, count in (("same", 1), ("unique", NUMBER)):
+            slow = measure(
+                xml, [xml_template.format(i % count) for i in range(NUMBER)]
+            )
+            fast = measure(
+                brackets, [brackets_template.format(i % count) for i in range(NUMBER)]
+            )
+            print(
+                f"{name:<7} {kind:<7} xml {slow:7.2f} us  "
+                f"brackets {fast:6.2f} us  {slow / fast:5.1f}x"
+            )
+
+    template = "<bold>{method}</bold> <green>{path}</green> <red>{status}</red>"
+    values = {"method": "GET", "path": "/index.html", "status": "404"}
+    compiled = adorable.compile_markup(template, STYLE)
+    slow = measure(
+        lambda _: adorable.markup_xml(template, dict(STYLE), ((), values)),
+        [0] * NUMBER,
+    )
+    fast = measure(lambda _: compiled.render(**values), [0] * NUMBER)
+    print(
+        f"{'template':<15} xml {slow:7.2f} us  "
+        f"compiled {fast:6.2f} us  {slow / fast:5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
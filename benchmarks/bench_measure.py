@@ -0,0 +1,85 @@
+"""
+Compares ``adorable.strip_ansi`` and ``adorable.visible_width``
+with ``adorable.ANSI_REGEX``.
+
+Log lines are stripped once each. Table cells are measured
+repeatedly, like when aligning the columns of a table that
+is printed many times.
+
+Plain lines take the fast path without an escape character
+and are several times faster. Styled lines are about as fast
+as ``ANSI_REGEX.sub``: each of their sequences is matched by
+the regex, and skipping the text before the first escape
+character with ``str.find`` or scanning for each escape
+character in Python did not make them faster.
+
+Run from the repository root::
+
+    python benchmarks/bench_measure.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import adorable  # noqa: E402
+from adorable import color  # noqa: E402
+
+NUMBER = 10
+
+adorable.use("BIT8")
+RED = color.from_name("red").fg
+GREEN = color.from_name("green").fg
+
+LINES = {
+    "plain": [f"GET /index/{i}.html 200 0.{i}ms" for i in range(5000)],
+    "mixed": [
+        RED(f"line {i}") if i % 10 == 0 else f"line {i} of plain text"
+        for i in range(5000)
+    ],
+    "styled": [
+        f"{GREEN('GET')} /index/{i}.html {RED(str(i))} {adorable.BOLD('0.42ms')}"
+        for i in range(5000)
+    ],
+}
+
+CELLS = [
+    cell
+    for row in range(1000)
+    for cell in (
+        GREEN("GET") if row % 3 else RED("POST"),
+        f"/index/{row % 200}.html",
+        RED("404") if row % 7 == 0 else "200",
+    )
+]
+
+
+def ratio(slow, fast) -> float:
+    slow_time = min(timeit.repeat(slow, number=NUMBER, repeat=5))
+    fast_time = min(timeit.repeat(fast, number=NUMBER, repeat=5))
+    return slow_time / fast_time
+
+
+def main() -> None:
+    regex = adorable.ANSI_REGEX
+    strip_ansi = adorable.strip_ansi
+    visible_width = adorable.visible_width
+
+    for name, lines in LINES.items():
+        speedup = ratio(
+            lambda: [regex.sub("", line) for line in lines],
+            lambda: [strip_ansi(line) for line in lines],
+        )
+        print(f"strip {name:<7} {speedup:5.1f}x faster than ANSI_REGEX.sub")
+
+    speedup = ratio(
+        lambda: [len(regex.sub("", cell)) for cell in CELLS],
+        lambda: [visible_width(cell) for cell in CELLS],
+    )
+    print(f"width cells   {speedup:5.1f}x faster than len(ANSI_REGEX.sub)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Compares the ways of styling a string.
+
+Run from the repository root::
+
+    python benchmarks/bench_paint.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import adorable  # noqa: E402
+from adorable import color  # noqa: E402
+
+NUMBER = 200_000
+
+adorable.use("BIT8")
+RED = color.from_name("red").fg
+red = RED.compile()
+line = "GET /index.html 200 0.42ms"
+
+CASES = {
+    "Color.__call__": "RED(line)",
+    "paint": "adorable.paint(line, style=RED)",
+    "compiled": "red(line)",
+}
+
+
+def main() -> None:
+    results = {}
+    for name, stmt in CASES.items():
+        seconds = min(timeit.repeat(stmt, number=NUMBER, repeat=5, globals=globals()))
+        results[name] = seconds
+        print(f"{name:<16} {seconds / NUMBER * 1e9:8.1f} ns/call")
+
+    speedup = results["Color.__call__"] / results["compiled"]
+    print(f"compiled is {speedup:.1f}x faster than Color.__call__")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares rendering a window of a large :class:`adorable.Text`
+with and without the span index.
+
+The document has about nine million characters and two hundred
+thousand spans, like a log file in a pager. Each run renders
+100 windows of 80 lines at random positions.
+
+Run from the repository root::
+
+    python benchmarks/bench_text.py
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import adorable  # noqa: E402
+from adorable import text as text_module  # noqa: E402
+from adorable import Text  # noqa: E402
+
+NUMBER = 3
+
+STYLES = [adorable.BOLD, adorable.ITALIC, adorable.UNDERLINE]
+
+DOCUMENT = Text().join(
+    Text(f"{i:>8} ", STYLES[i % 3]) + f"line of the log file number {i}\n"
+    for i in range(200_000)
+)
+
+rng = random.Random(0)
+WINDOWS = [rng.randrange(len(DOCUMENT) - 4000) for _ in range(100)]
+
+
+def render_windows() -> None:
+    for start in WINDOWS:
+        DOCUMENT[start : start + 4000].render()
+
+
+def main() -> None:
+    threshold = text_module._INDEX_THRESHOLD
+
+    text_module._INDEX_THRESHOLD = len(DOCUMENT)
+    scan = min(timeit.repeat(render_windows, number=NUMBER, repeat=3))
+
+    text_module._INDEX_THRESHOLD = threshold
+    # builds the index
+    DOCUMENT[:1]
+    index = min(timeit.repeat(render_windows, number=NUMBER, repeat=3))
+
+    print(f"{len(DOCUMENT)} characters, {len(DOCUMENT.spans)} spans")
+    print(f"windows {scan / index:6.1f}x faster with the span index")
+
+
+if __name__ == "__main__":
+    main()
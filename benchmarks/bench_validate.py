@@ -0,0 +1,50 @@
+"""
+Measures the overhead of validating colors when
+they are rendered.
+
+Run from the repository root::
+
+    python benchmarks/bench_validate.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import adorable  # noqa: E402
+from adorable import color  # noqa: E402
+
+NUMBER = 200_000
+
+adorable.use("BIT8")
+RED = color.from_name("red").fg
+line = "GET /index.html 200 0.42ms"
+
+CASES = {
+    "Color.__call__": "RED(line)",
+    "Color.enable_str": "RED.enable_str()",
+}
+
+
+def main() -> None:
+    for name, stmt in CASES.items():
+        timings = []
+        for validate in [True, False]:
+            adorable.configure(validate=validate)
+            seconds = min(
+                timeit.repeat(stmt, number=NUMBER, repeat=5, globals=globals())
+            )
+            timings.append(seconds / NUMBER * 1e9)
+
+        checked, unchecked = timings
+        print(
+            f"{name:<18} validate=True {checked:8.1f} ns/call  "
+            f"validate=False {unchecked:8.1f} ns/call  "
+            f"(-{checked - unchecked:.1f} ns)"
+        )
+
+
+if __name__ == "__main__":
+    main()
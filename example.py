@@ -1,6 +1,6 @@
 import adorable
 
-RED = adorable.color.from_hex(0x730005)
+RED = adorable.color.from_hex(0x730005).bg
 YELLOW = adorable.color.from_name("yellow")
 
 ERROR = YELLOW.on(RED)
@@ -1,11 +1,19 @@
-from collections.abc import Mapping
-from typing import Any
+"""
+Functions and classes of the submodules that are not
+needed to style a string (colors, markup, stylesheets,
+writers, ...) are imported on first access. ``import
+adorable`` therefore stays cheap for programs that
+only call :func:`paint`.
 
-from .color import (
-    Color3bit,
-    Color8bit,
-    Color24bit,
-)
+.. versionchanged:: 0.2.0
+    Submodules are imported lazily.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Any, Optional, TYPE_CHECKING
 
 from .style import (
     BOLD,
@@ -19,14 +27,136 @@ from .style import (
 )
 
 from .ansi import *
-from .markup import *
-from .stylesheet import *
-from .stylesheet import _globals
-from . import term
+
+if TYPE_CHECKING:
+    from .color import (
+        Color3bit,
+        Color8bit,
+        Color24bit,
+    )
+    from .quantize import Palette
+    from .markup import *
+    from .stylesheet import export, load_stylesheet, remove_all, remove_style
+    from .stylesheet import _globals
+    from . import color, term
+    from .decoder import AnsiDecoder
+    from .encoder import Encoder
+    from .measure import strip_ansi, visible_width
+    from .text import Text
+    from .writer import BackgroundWriter, DowngradingStream, StyledWriter
+
+
+_SUBMODULES: frozenset[str] = frozenset(
+    {
+        "aio",
+        "color",
+        "decoder",
+        "encoder",
+        "markup",
+        "measure",
+        "quantize",
+        "stylesheet",
+        "term",
+        "text",
+        "utils",
+        "webcolors",
+        "writer",
+    }
+)
+"""Submodules that are imported on first access."""
+
+_LAZY: dict[str, str] = {
+    "Color3bit": "color",
+    "Color8bit": "color",
+    "Color24bit": "color",
+    "Palette": "quantize",
+    "insert": "markup",
+    "markup_xml": "markup",
+    "compile_markup": "markup",
+    "MarkupTemplate": "markup",
+    "markup_brackets": "markup",
+    "escape_markup": "markup",
+    "MarkupParser": "markup",
+    "export": "stylesheet",
+    "load_stylesheet": "stylesheet",
+    "remove_all": "stylesheet",
+    "remove_style": "stylesheet",
+    "_globals": "stylesheet",
+    "strip_ansi": "measure",
+    "visible_width": "measure",
+    "AnsiDecoder": "decoder",
+    "Encoder": "encoder",
+    "Text": "text",
+    "BackgroundWriter": "writer",
+    "DowngradingStream": "writer",
+    "StyledWriter": "writer",
+}
+"""Attributes that are imported on first access and their submodule."""
+
+# star imports load the lazy attributes and submodules via __getattr__
+__all__ = [
+    "BOLD",
+    "DIM",
+    "ITALIC",
+    "UNDERLINE",
+    "BLINK",
+    "INVERSE",
+    "INVISIBLE",
+    "STRIKETHROUGH",
+    "Ansi",
+    "AnsiNull",
+    "paint",
+    "formatc",
+    "painter",
+    "printc",
+    "ANSI_REGEX",
+    "use",
+    "configure",
+    "filter_ansi",
+    "ansi",
+    "color",
+    "markup",
+    "style",
+    "stylesheet",
+    "term",
+    "utils",
+    "webcolors",
+    *[name for name in _LAZY if not name.startswith("_")],
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        # importing a submodule also sets it as attribute
+        return import_module(f".{name}", __name__)
+
+    if name in _LAZY:
+        value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+
+    elif name == "ANSI_REGEX":
+        value = re.compile("\x1b\\[.*?[ABCDEFGHJKfnsumlh]")
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
 
 
-ANSI_REGEX = re.compile("\x1b\\[.*?[ABCDEFGHJKfnsumlh]")
-"""Regex pattern that matches most ansi escape sequences."""
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES, *_LAZY, "ANSI_REGEX"})
+
+
+ANSI_REGEX: re.Pattern[str]
+"""
+Regex pattern that matches most ansi escape sequences.
+
+.. seealso::
+
+   :func:`adorable.measure.strip_ansi` and
+   :data:`adorable.measure.ANSI_PATTERN` which match
+   all escape sequences and are faster.
+"""
 
 
 def use(terminal: str) -> None:
@@ -36,6 +166,10 @@ def use(terminal: str) -> None:
     A quick way of overriding the current color
     system manually.
 
+    .. versionchanged:: 0.2.0
+        Also overrides the color system of every
+        stream (see :meth:`adorable.term.Terminal.for_stream`).
+
     Parameters
     ----------
     terminal
@@ -43,7 +177,33 @@ def use(terminal: str) -> None:
         be ``"NOCOLOR"``, ``"BIT3"``, ``"BIT8``
         or ``"BIT24"``.
     """
-    term.cache = term.Terminal[terminal]
+    from . import term as _term
+
+    _term.cache = _term.override = _term.Terminal[terminal]
+
+
+def configure(*, validate: Optional[bool] = None) -> None:
+    """
+    .. versionadded:: 0.2.0
+
+    Changes global settings. Settings that are not
+    provided stay unchanged.
+
+    Parameters
+    ----------
+    validate
+        Whether colors are checked to be initialized
+        each time they are rendered. Disabling this
+        ("release mode") makes rendering faster.
+
+        .. seealso::
+
+           :data:`adorable.color.validate`
+    """
+    if validate is not None:
+        from . import color as _color
+
+        _color.validate = validate
 
 
 def filter_ansi(style: Mapping[str, Any]) -> dict[str, Ansi]:
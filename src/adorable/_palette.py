@@ -1,287 +1,103 @@
 """
 All rgb values of ansi colors 3bit to 8bit.
+
+The values are stored as packed bytes (three bytes
+per color) which are cheaper to load than a list of
+tuples.
 """
 
-from itertools import starmap
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Union, overload
+
 from .utils import RGB
 
-ANSI3BIT = list(
-    starmap(
-        RGB,
-        [
-            (0, 0, 0),
-            (100, 20, 20),
-            (50, 170, 50),
-            (200, 200, 45),
-            (115, 150, 200),
-            (160, 30, 160),
-            (45, 185, 185),
-            (230, 230, 230),
-        ],
+
+class PackedPalette(Sequence[RGB]):
+    """
+    Read-only sequence of rgb values stored as packed
+    bytes. Colors are created on access.
+
+    Parameters
+    ----------
+    data
+        The red, green and blue channel of every color.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        if len(data) % 3:
+            raise ValueError("length of data must be a multiple of 3")
+
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.data) // 3
+
+    @overload
+    def __getitem__(self, index: int) -> RGB: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RGB]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[RGB, list[RGB]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        i = range(len(self))[index] * 3
+        data = self.data
+        return RGB(data[i], data[i + 1], data[i + 2])
+
+    def __iter__(self) -> Iterator[RGB]:
+        channels = iter(self.data)
+        return map(RGB._make, zip(channels, channels, channels))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+ANSI3BIT = PackedPalette(
+    bytes.fromhex(
+        "000000 641414 32aa32 c8c82d 7396c8 a01ea0 2db9b9 e6e6e6"
     )
 )
 
 
-ANSI8BIT = list(
-    starmap(
-        RGB,
-        [
-            (0, 0, 0),
-            (128, 0, 0),
-            (0, 128, 0),
-            (128, 128, 0),
-            (0, 0, 128),
-            (128, 0, 128),
-            (0, 128, 128),
-            (192, 192, 192),
-            (128, 128, 128),
-            (255, 0, 0),
-            (0, 255, 0),
-            (255, 255, 0),
-            (0, 0, 255),
-            (255, 0, 255),
-            (0, 255, 255),
-            (255, 255, 255),
-            (0, 0, 0),
-            (0, 0, 95),
-            (0, 0, 135),
-            (0, 0, 175),
-            (0, 0, 215),
-            (0, 0, 255),
-            (0, 95, 0),
-            (0, 95, 95),
-            (0, 95, 135),
-            (0, 95, 175),
-            (0, 95, 215),
-            (0, 95, 255),
-            (0, 135, 0),
-            (0, 135, 95),
-            (0, 135, 135),
-            (0, 135, 175),
-            (0, 135, 215),
-            (0, 135, 255),
-            (0, 175, 0),
-            (0, 175, 95),
-            (0, 175, 135),
-            (0, 175, 175),
-            (0, 175, 215),
-            (0, 175, 255),
-            (0, 215, 0),
-            (0, 215, 95),
-            (0, 215, 135),
-            (0, 215, 175),
-            (0, 215, 215),
-            (0, 215, 255),
-            (0, 255, 0),
-            (0, 255, 95),
-            (0, 255, 135),
-            (0, 255, 175),
-            (0, 255, 215),
-            (0, 255, 255),
-            (95, 0, 0),
-            (95, 0, 95),
-            (95, 0, 135),
-            (95, 0, 175),
-            (95, 0, 215),
-            (95, 0, 255),
-            (95, 95, 0),
-            (95, 95, 95),
-            (95, 95, 135),
-            (95, 95, 175),
-            (95, 95, 215),
-            (95, 95, 255),
-            (95, 135, 0),
-            (95, 135, 95),
-            (95, 135, 135),
-            (95, 135, 175),
-            (95, 135, 215),
-            (95, 135, 255),
-            (95, 175, 0),
-            (95, 175, 95),
-            (95, 175, 135),
-            (95, 175, 175),
-            (95, 175, 215),
-            (95, 175, 255),
-            (95, 215, 0),
-            (95, 215, 95),
-            (95, 215, 135),
-            (95, 215, 175),
-            (95, 215, 215),
-            (95, 215, 255),
-            (95, 255, 0),
-            (95, 255, 95),
-            (95, 255, 135),
-            (95, 255, 175),
-            (95, 255, 215),
-            (95, 255, 255),
-            (135, 0, 0),
-            (135, 0, 95),
-            (135, 0, 135),
-            (135, 0, 175),
-            (135, 0, 215),
-            (135, 0, 255),
-            (135, 95, 0),
-            (135, 95, 95),
-            (135, 95, 135),
-            (135, 95, 175),
-            (135, 95, 215),
-            (135, 95, 255),
-            (135, 135, 0),
-            (135, 135, 95),
-            (135, 135, 135),
-            (135, 135, 175),
-            (135, 135, 215),
-            (135, 135, 255),
-            (135, 175, 0),
-            (135, 175, 95),
-            (135, 175, 135),
-            (135, 175, 175),
-            (135, 175, 215),
-            (135, 175, 255),
-            (135, 215, 0),
-            (135, 215, 95),
-            (135, 215, 135),
-            (135, 215, 175),
-            (135, 215, 215),
-            (135, 215, 255),
-            (135, 255, 0),
-            (135, 255, 95),
-            (135, 255, 135),
-            (135, 255, 175),
-            (135, 255, 215),
-            (135, 255, 255),
-            (175, 0, 0),
-            (175, 0, 95),
-            (175, 0, 135),
-            (175, 0, 175),
-            (175, 0, 215),
-            (175, 0, 255),
-            (175, 95, 0),
-            (175, 95, 95),
-            (175, 95, 135),
-            (175, 95, 175),
-            (175, 95, 215),
-            (175, 95, 255),
-            (175, 135, 0),
-            (175, 135, 95),
-            (175, 135, 135),
-            (175, 135, 175),
-            (175, 135, 215),
-            (175, 135, 255),
-            (175, 175, 0),
-            (175, 175, 95),
-            (175, 175, 135),
-            (175, 175, 175),
-            (175, 175, 215),
-            (175, 175, 255),
-            (175, 215, 0),
-            (175, 215, 95),
-            (175, 215, 135),
-            (175, 215, 175),
-            (175, 215, 215),
-            (175, 215, 255),
-            (175, 255, 0),
-            (175, 255, 95),
-            (175, 255, 135),
-            (175, 255, 175),
-            (175, 255, 215),
-            (175, 255, 255),
-            (215, 0, 0),
-            (215, 0, 95),
-            (215, 0, 135),
-            (215, 0, 175),
-            (215, 0, 215),
-            (215, 0, 255),
-            (215, 95, 0),
-            (215, 95, 95),
-            (215, 95, 135),
-            (215, 95, 175),
-            (215, 95, 215),
-            (215, 95, 255),
-            (215, 135, 0),
-            (215, 135, 95),
-            (215, 135, 135),
-            (215, 135, 175),
-            (215, 135, 215),
-            (215, 135, 255),
-            (215, 175, 0),
-            (215, 175, 95),
-            (215, 175, 135),
-            (215, 175, 175),
-            (215, 175, 215),
-            (215, 175, 255),
-            (215, 215, 0),
-            (215, 215, 95),
-            (215, 215, 135),
-            (215, 215, 175),
-            (215, 215, 215),
-            (215, 215, 255),
-            (215, 255, 0),
-            (215, 255, 95),
-            (215, 255, 135),
-            (215, 255, 175),
-            (215, 255, 215),
-            (215, 255, 255),
-            (255, 0, 0),
-            (255, 0, 95),
-            (255, 0, 135),
-            (255, 0, 175),
-            (255, 0, 215),
-            (255, 0, 255),
-            (255, 95, 0),
-            (255, 95, 95),
-            (255, 95, 135),
-            (255, 95, 175),
-            (255, 95, 215),
-            (255, 95, 255),
-            (255, 135, 0),
-            (255, 135, 95),
-            (255, 135, 135),
-            (255, 135, 175),
-            (255, 135, 215),
-            (255, 135, 255),
-            (255, 175, 0),
-            (255, 175, 95),
-            (255, 175, 135),
-            (255, 175, 175),
-            (255, 175, 215),
-            (255, 175, 255),
-            (255, 215, 0),
-            (255, 215, 95),
-            (255, 215, 135),
-            (255, 215, 175),
-            (255, 215, 215),
-            (255, 215, 255),
-            (255, 255, 0),
-            (255, 255, 95),
-            (255, 255, 135),
-            (255, 255, 175),
-            (255, 255, 215),
-            (255, 255, 255),
-            (8, 8, 8),
-            (18, 18, 18),
-            (28, 28, 28),
-            (38, 38, 38),
-            (48, 48, 48),
-            (58, 58, 58),
-            (68, 68, 68),
-            (78, 78, 78),
-            (88, 88, 88),
-            (98, 98, 98),
-            (108, 108, 108),
-            (118, 118, 118),
-            (128, 128, 128),
-            (138, 138, 138),
-            (148, 148, 148),
-            (158, 158, 158),
-            (168, 168, 168),
-            (178, 178, 178),
-            (188, 188, 188),
-            (198, 198, 198),
-            (208, 208, 208),
-            (218, 218, 218),
-            (228, 228, 228),
-            (238, 238, 238),
-        ],
+ANSI8BIT = PackedPalette(
+    bytes.fromhex(
+        "000000 800000 008000 808000 000080 800080 008080 c0c0c0"
+        "808080 ff0000 00ff00 ffff00 0000ff ff00ff 00ffff ffffff"
+        "000000 00005f 000087 0000af 0000d7 0000ff 005f00 005f5f"
+        "005f87 005faf 005fd7 005fff 008700 00875f 008787 0087af"
+        "0087d7 0087ff 00af00 00af5f 00af87 00afaf 00afd7 00afff"
+        "00d700 00d75f 00d787 00d7af 00d7d7 00d7ff 00ff00 00ff5f"
+        "00ff87 00ffaf 00ffd7 00ffff 5f0000 5f005f 5f0087 5f00af"
+        "5f00d7 5f00ff 5f5f00 5f5f5f 5f5f87 5f5faf 5f5fd7 5f5fff"
+        "5f8700 5f875f 5f8787 5f87af 5f87d7 5f87ff 5faf00 5faf5f"
+        "5faf87 5fafaf 5fafd7 5fafff 5fd700 5fd75f 5fd787 5fd7af"
+        "5fd7d7 5fd7ff 5fff00 5fff5f 5fff87 5fffaf 5fffd7 5fffff"
+        "870000 87005f 870087 8700af 8700d7 8700ff 875f00 875f5f"
+        "875f87 875faf 875fd7 875fff 878700 87875f 878787 8787af"
+        "8787d7 8787ff 87af00 87af5f 87af87 87afaf 87afd7 87afff"
+        "87d700 87d75f 87d787 87d7af 87d7d7 87d7ff 87ff00 87ff5f"
+        "87ff87 87ffaf 87ffd7 87ffff af0000 af005f af0087 af00af"
+        "af00d7 af00ff af5f00 af5f5f af5f87 af5faf af5fd7 af5fff"
+        "af8700 af875f af8787 af87af af87d7 af87ff afaf00 afaf5f"
+        "afaf87 afafaf afafd7 afafff afd700 afd75f afd787 afd7af"
+        "afd7d7 afd7ff afff00 afff5f afff87 afffaf afffd7 afffff"
+        "d70000 d7005f d70087 d700af d700d7 d700ff d75f00 d75f5f"
+        "d75f87 d75faf d75fd7 d75fff d78700 d7875f d78787 d787af"
+        "d787d7 d787ff d7af00 d7af5f d7af87 d7afaf d7afd7 d7afff"
+        "d7d700 d7d75f d7d787 d7d7af d7d7d7 d7d7ff d7ff00 d7ff5f"
+        "d7ff87 d7ffaf d7ffd7 d7ffff ff0000 ff005f ff0087 ff00af"
+        "ff00d7 ff00ff ff5f00 ff5f5f ff5f87 ff5faf ff5fd7 ff5fff"
+        "ff8700 ff875f ff8787 ff87af ff87d7 ff87ff ffaf00 ffaf5f"
+        "ffaf87 ffafaf ffafd7 ffafff ffd700 ffd75f ffd787 ffd7af"
+        "ffd7d7 ffd7ff ffff00 ffff5f ffff87 ffffaf ffffd7 ffffff"
+        "080808 121212 1c1c1c 262626 303030 3a3a3a 444444 4e4e4e"
+        "585858 626262 6c6c6c 767676 808080 8a8a8a 949494 9e9e9e"
+        "a8a8a8 b2b2b2 bcbcbc c6c6c6 d0d0d0 dadada e4e4e4 eeeeee"
     )
 )
@@ -0,0 +1,165 @@
+"""
+.. versionadded:: 0.2.0
+
+Styled output for :pylib:`asyncio`.
+"""
+
+from __future__ import annotations
+
+__all__ = ["AsyncStyledWriter", "aprintc"]
+
+import asyncio
+import os
+import sys
+from typing import Any, BinaryIO, Optional
+
+from .ansi import Ansi, paint
+
+
+class AsyncStyledWriter:
+    """
+    Writes styled text to an :pylib:`asyncio` stream
+    without blocking the event loop.
+
+    Every write waits for :meth:`drain`, so a slow
+    terminal or pipe slows down the writing task
+    instead of filling up memory.
+
+    Examples
+    --------
+    .. code-block::
+
+       out = await AsyncStyledWriter.connect()
+       await out.printc("ready", style=GREEN)
+
+    Parameters
+    ----------
+    writer
+        The stream to write to.
+
+    encoding
+        Encoding of the text.
+    """
+
+    def __init__(
+        self, writer: asyncio.StreamWriter, encoding: str = "utf-8"
+    ) -> None:
+        self.writer = writer
+        self.encoding = encoding
+
+    @classmethod
+    async def connect(
+        cls, pipe: Optional[BinaryIO] = None, encoding: str = "utf-8"
+    ) -> AsyncStyledWriter:
+        """
+        Creates a writer for a pipe, a socket or a
+        character device such as a terminal.
+
+        Parameters
+        ----------
+        pipe
+            The file to write to. Closing the writer
+            closes the file. Defaults to a duplicate of
+            standard output, so closing the writer leaves
+            standard output open.
+
+        encoding
+            Encoding of the text.
+        """
+        loop = asyncio.get_running_loop()
+
+        if pipe is None:
+            pipe = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+
+        reader = asyncio.StreamReader()
+        transport, protocol = await loop.connect_write_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), pipe
+        )
+        writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+        return cls(writer, encoding)
+
+    async def write(self, text: str, style: Optional[Ansi] = None) -> None:
+        """
+        Writes a styled string.
+
+        Parameters
+        ----------
+        text
+            The text to write.
+
+        style
+            Ansi object that styles the text.
+        """
+        if style is not None:
+            text = paint(text, style=style)
+
+        self.writer.write(text.encode(self.encoding))
+        await self.writer.drain()
+
+    async def printc(
+        self,
+        *args: Any,
+        style: Optional[Ansi] = None,
+        sep: str = " ",
+        end: str = "\n",
+    ) -> None:
+        """
+        Writes a styled string like :func:`adorable.printc`
+        prints it.
+
+        Parameters
+        ----------
+        args
+            Objects to style.
+
+        style
+            Ansi object that styles the string.
+
+        sep
+            String that separates ``args``.
+
+        end
+            String appended after the styled string.
+        """
+        await self.write(paint(*args, style=style, sep=sep) + end)
+
+    async def drain(self) -> None:
+        """
+        Waits until the stream accepts more data.
+        """
+        await self.writer.drain()
+
+    def close(self) -> None:
+        """
+        Closes the stream.
+        """
+        self.writer.close()
+
+    async def wait_closed(self) -> None:
+        """
+        Waits until the stream is closed.
+        """
+        await self.writer.wait_closed()
+
+
+async def aprintc(*args: Any, file: AsyncStyledWriter, **kwargs: Any) -> None:
+    """
+    Prints a styled string without blocking the event
+    loop.
+
+    This function takes the same arguments as
+    :func:`adorable.printc` except that ``file``
+    is required.
+
+    Parameters
+    ----------
+    args
+        Objects to style.
+
+    file
+        The writer to print to.
+
+    kwargs
+        ``style``, ``sep`` and ``end``.
+    """
+    await file.printc(*args, **kwargs)
@@ -3,14 +3,23 @@ from __future__ import annotations
 from abc import ABC
 from copy import copy
 import re
+import sys
 from sys import stdout
 from types import TracebackType
-from typing import Any, Literal, Optional, TextIO
+from typing import Any, Callable, Literal, Optional, TextIO, TYPE_CHECKING
 
 from .utils import _copydoc
 
+if TYPE_CHECKING:
+    from .encoder import Encoder
 
-def paint(*args: Any, style: Optional[Ansi] = None, sep: str = " ") -> str:
+
+def paint(
+    *args: Any,
+    style: Optional[Ansi] = None,
+    sep: str = " ",
+    encoder: Optional[Encoder] = None,
+) -> str:
     """
     Styles a string.
 
@@ -26,12 +35,25 @@ def paint(*args: Any, style: Optional[Ansi] = None, sep: str = " ") -> str:
     sep
         String that separates ``args``.
 
+    encoder
+        .. versionadded:: 0.2.0
+
+        Encodes the string with as few escape sequences
+        as possible. The style is not disabled at the
+        end, so that following strings with the same
+        style need no escape sequence. Call
+        :meth:`adorable.encoder.Encoder.close` after
+        the last string.
+
     Returns
     -------
     The styled string.
     """
     content = sep.join(map(str, args))
 
+    if encoder is not None:
+        return encoder.write(content, style)
+
     if style is None:
         return content
 
@@ -41,13 +63,61 @@ def paint(*args: Any, style: Optional[Ansi] = None, sep: str = " ") -> str:
             f"got {style.__class__.__name__}"
         )
 
-    return f"{style}{content}{style.disable_str()}"
+    return f"{style.enable_str()}{content}{style.disable_str()}"
 
 
 formatc = paint  # noqa: E305
 """Alias of :func:`paint`."""
 
 
+def painter(
+    style: Optional[Ansi] = None, sep: str = " "
+) -> Callable[..., str]:
+    """
+    .. versionadded:: 0.2.0
+
+    Returns a function that styles a string like
+    :func:`paint` does. The escape sequences are
+    computed once, so calling the returned function
+    costs little more than a string concatenation.
+
+    Examples
+    --------
+    .. code-block::
+
+       red = painter(color.from_name("red").fg)
+       print(red("Hello World"))
+
+    Parameters
+    ----------
+    style
+        Ansi object that styles the string.
+
+    sep
+        String that separates the arguments.
+    """
+    if style is None:
+        prefix = suffix = ""
+
+    elif not isinstance(style, Ansi):
+        raise TypeError(
+            "expected `None` or `Ansi` for argument `style`, "
+            f"got {style.__class__.__name__}"
+        )
+
+    else:
+        prefix = style.enable_str()
+        suffix = style.disable_str()
+
+    def paint_(*args: Any) -> str:
+        if len(args) == 1:
+            return f"{prefix}{args[0]!s}{suffix}"
+
+        return f"{prefix}{sep.join(map(str, args))}{suffix}"
+
+    return paint_
+
+
 def printc(*args: Any, **kwargs: Any) -> None:
     """
     Prints a styled string.
@@ -69,7 +139,7 @@ def printc(*args: Any, **kwargs: Any) -> None:
     """
     paint_kwargs = {}
 
-    for key in ["style", "sep"]:
+    for key in ["style", "sep", "encoder"]:
         if key in kwargs:
             paint_kwargs[key] = kwargs.pop(key)
 
@@ -77,12 +147,66 @@ def printc(*args: Any, **kwargs: Any) -> None:
 
 
 class Ansi(ABC):
-    _ansi: list[Any]
-    _off: list[Any]
+    """
+    Base class of all ansi objects.
+
+    .. versionchanged:: 0.2.0
+        Ansi objects are immutable. Combining them via
+        ``+`` returns a new object. Ansi objects are
+        hashable and compared by their escape sequences.
+
+    .. versionchanged:: 0.2.0
+        The escape sequences are computed once and
+        reused afterwards.
+    """
+
+    __slots__ = ("_ansi", "_off", "_enable", "_disable")
+
+    _ansi: tuple[Any, ...]
+    _off: tuple[Any, ...]
+    _enable: str
+    _disable: str
 
     def __str__(self) -> str:
         return self.enable_str()
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Ansi):
+            return NotImplemented
+
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self._ansi!r}>"
+
+    def _key(self) -> tuple[Any, ...]:
+        """
+        Returns the values that identify this object.
+        """
+        return (self._ansi, self._off)
+
+    def _replace(self, ansi: tuple[Any, ...], off: tuple[Any, ...]) -> Any:
+        """
+        Returns a copy of this object with other
+        escape sequence parameters.
+        """
+        obj = copy(self)
+        obj._ansi = ansi
+        obj._off = off
+        obj._invalidate()
+        return obj
+
+    def _invalidate(self) -> None:
+        """
+        Drops the cached escape sequences.
+        """
+        for name in ("_enable", "_disable"):
+            if hasattr(self, name):
+                delattr(self, name)
+
     @_copydoc(paint, replace={re.compile("style.+?the string.", re.DOTALL): ""})
     def __call__(self, *args: Any, **kwargs: Any) -> str:
         return paint(*args, style=self, **kwargs)
@@ -91,16 +215,20 @@ class Ansi(ABC):
         """
         Combines two styles.
         """
-        obj = copy(self)
-        obj.extend(other)
+        if not isinstance(other, Ansi):
+            return NotImplemented
 
-        return obj
+        return self._replace(self._ansi + other._ansi, self._off + other._off)
 
     def __iadd__(self, other: Ansi) -> Ansi:
         """
         Combines this and another style.
+
+        .. versionchanged:: 0.2.0
+            Returns a new object instead of modifying
+            this one.
         """
-        return self.extend(other)
+        return self + other
 
     def __enter__(self) -> None:
         """
@@ -130,20 +258,43 @@ class Ansi(ABC):
         """
         return f"{self.enable_str()}{format_spec}{self.disable_str()}"
 
+    def compile(self, sep: str = " ") -> Callable[..., str]:
+        """
+        .. versionadded:: 0.2.0
+
+        Returns a function that styles a string with
+        this style.
+
+        .. seealso::
+
+           :func:`painter`
+        """
+        return painter(self, sep=sep)
+
     def extend(self, *others: Ansi) -> Ansi:
         """
-        Adds other ansi styles to this style.
+        Combines this style with other ansi styles.
+
+        .. versionchanged:: 0.2.0
+            Returns a new object instead of modifying
+            this one, like ``+``.
         """
+        ansi = self._ansi
+        off = self._off
         for other in others:
-            self._ansi.extend(other._ansi)
-            self._off.extend(other._off)
-        return self
+            ansi += other._ansi
+            off += other._off
+        return self._replace(ansi, off)
 
     def enable_str(self) -> str:
         """
         Returns escape sequence to enable the ansi style.
         """
-        return _get_ansi_string(*self._ansi)
+        try:
+            return self._enable
+        except AttributeError:
+            self._enable = _get_ansi_string(*self._ansi)
+            return self._enable
 
     def enable(self, file: Optional[TextIO] = None) -> None:
         """
@@ -161,7 +312,11 @@ class Ansi(ABC):
         """
         Returns escape sequence to disable the ansi style.
         """
-        return _get_ansi_string(*self._off)
+        try:
+            return self._disable
+        except AttributeError:
+            self._disable = _get_ansi_string(*self._off)
+            return self._disable
 
     def disable(self, file: Optional[TextIO] = None) -> None:
         """
@@ -196,9 +351,18 @@ class AnsiNull(Ansi):
 
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
-        self._ansi = []
-        self._off = []
+        self._ansi = ()
+        self._off = ()
+
+
+_SGR_STRINGS_LIMIT: int = 4096
+"""Maximum number of entries in :data:`_sgr_strings`."""
+
+_sgr_strings: dict[tuple[Any, ...], str] = {}
+"""Escape sequences by their arguments."""
 
 
 def _get_ansi_string(*args: Any) -> str:
@@ -207,6 +371,10 @@ def _get_ansi_string(*args: Any) -> str:
     argument with a semicolon (``;``). Every provided
     argument will be turned into a string.
 
+    .. versionchanged:: 0.2.0
+        Escape sequences are interned, so equal styles
+        share the same string.
+
     Examples
     --------
     .. repl::
@@ -214,4 +382,14 @@ def _get_ansi_string(*args: Any) -> str:
        from adorable.ansi import _get_ansi_string
        _get_ansi_string(38, 5, "20")
     """
-    return f"\x1b[{';'.join(map(str, args))}m"
+    try:
+        return _sgr_strings[args]
+    except KeyError:
+        pass
+
+    if len(_sgr_strings) >= _SGR_STRINGS_LIMIT:
+        _sgr_strings.clear()
+
+    params = ";".join(map(str, args))
+    string = _sgr_strings[args] = sys.intern(f"\x1b[{params}m")
+    return string
@@ -5,24 +5,50 @@ Utilities for creating color objects.
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from collections.abc import Callable
-from copy import copy
+from collections.abc import Callable, Iterable, Sequence
 from enum import auto, IntEnum
+from functools import lru_cache
 import operator
-from typing import Any, Union
+import os
+import re
+from typing import Any, Optional, TextIO, Union
 import warnings
 
 from . import _palette
-from . import webcolors
+from . import quantize
 from .ansi import Ansi, _get_ansi_string, paint
+from .quantize import Palette
 from .term import Terminal
-from .utils import _copydoc, _get_closest_color, RGB, HEX, T_RGB
+from .utils import _copydoc, HEX, T_RGB
 
 
 _NOT_INITIALIZED: str = "color not initialized"
 _ALREADY_INITIALIZED: str = "color already initialized"
 
 
+validate: bool = os.getenv("ADORABLE_VALIDATE", "1") != "0"
+"""
+.. versionadded:: 0.2.0
+
+Whether colors are checked to be initialized each
+time they are rendered. Creating and combining colors
+is always checked.
+
+Disabling this removes the check from
+:meth:`Color.__call__`, :meth:`Color.enable_str` and
+:meth:`Color.disable_str`. Rendering an uninitialized
+color then produces an empty escape sequence instead
+of raising an error.
+
+Defaults to ``False`` if the environment variable
+``ADORABLE_VALIDATE`` is set to ``0``.
+
+.. seealso::
+
+   :func:`adorable.configure`
+"""
+
+
 class _GroundError(Exception):
     pass
 
@@ -87,8 +113,14 @@ class Color(Ansi, metaclass=ABCMeta):
     """
     Abstract Base Class for terminal dependent
     colors.
+
+    .. versionchanged:: 0.2.0
+        Colors are immutable. :attr:`fg`, :attr:`bg`
+        and :meth:`on` return new colors.
     """
 
+    __slots__ = ("_data", "_ground")
+
     _termtype: Terminal
 
     def __init__(self, **data: Any):
@@ -107,8 +139,8 @@ class Color(Ansi, metaclass=ABCMeta):
             Various metadata set by subclasses
             for internal use.
         """
-        self._ansi: list[Any] = []
-        self._off = [0]
+        self._ansi = ()
+        self._off = (0,)
         self._data = data
         self._ground: _Ground = _Ground.NONE
 
@@ -152,39 +184,39 @@ class Color(Ansi, metaclass=ABCMeta):
                 (operator.ne, other, self, "both colors are set to the same ground"),
             )
 
-        elif not isinstance(other, Ansi):
-            return NotImplemented
-
-        obj = copy(self)
-        return obj.extend(other)
+        return super().__add__(other)
 
     def __iadd__(self, other: Ansi) -> Ansi:
-        if isinstance(other, Color):
-            _Ground.check(
-                (operator.ne, other, _Ground.NONE, _NOT_INITIALIZED),
-                (operator.ne, other, self, "both colors are set to the same ground"),
-            )
-
-        elif not isinstance(other, Ansi):
-            return NotImplemented
-
-        return self.extend(other)
+        return self + other
 
     def __call__(self, *args: Any, **kwargs: Any) -> str:
-        _Ground.check((operator.ne, self, _Ground.NONE, _NOT_INITIALIZED))
+        if validate:
+            _Ground.check((operator.ne, self, _Ground.NONE, _NOT_INITIALIZED))
 
         return paint(*args, style=self, **kwargs)
 
     def enable_str(self) -> str:
-        _Ground.check((operator.ne, self, _Ground.NONE, _NOT_INITIALIZED))
+        if validate:
+            _Ground.check((operator.ne, self, _Ground.NONE, _NOT_INITIALIZED))
 
         return super().enable_str()
 
     def disable_str(self) -> str:
-        _Ground.check((operator.ne, self, _Ground.NONE, _NOT_INITIALIZED))
+        if validate:
+            _Ground.check((operator.ne, self, _Ground.NONE, _NOT_INITIALIZED))
 
         return super().disable_str()
 
+    def _key(self) -> tuple[Any, ...]:
+        # the class and the color values tell uninitialized colors apart
+        return (
+            type(self),
+            self._ansi,
+            self._off,
+            self._ground,
+            tuple(sorted(self._data.items())),
+        )
+
     def is_initialized(self) -> bool:
         """
         .. versionadded:: 0.1.0
@@ -193,14 +225,21 @@ class Color(Ansi, metaclass=ABCMeta):
         """
         return self._ground != _Ground.NONE
 
-    def is_supported(self) -> bool:
+    def is_supported(self, stream: Optional[TextIO] = None) -> bool:
         """
         .. versionadded:: 0.1.1
 
         Checks if the color system is supported
         or not.
+
+        Parameters
+        ----------
+        stream
+            .. versionadded:: 0.2.0
+
+            Check the terminal of this stream instead.
         """
-        return self._termtype.is_supported()
+        return self._termtype.is_supported(stream)
 
     def _get_ansi(self) -> str:
         return _get_ansi_string(self._ansi)
@@ -213,33 +252,35 @@ class Color(Ansi, metaclass=ABCMeta):
         """
         ...
 
-    @property
-    def fg(self) -> Color:
+    def _with_ground(self, ground: _Ground) -> Color:
         """
-        Sets the color to foreground mode.
+        Returns a copy of the color set to ``ground``.
         """
         _Ground.check((operator.eq, self, _Ground.NONE, _ALREADY_INITIALIZED))
 
-        self._ansi.extend(self._form(_Ground.FORE))
-        self._ground = _Ground.FORE
+        ansi = self._ansi + tuple(self._form(ground))
+        obj: Color = self._replace(ansi, self._off)
+        obj._ground = ground
 
-        return self
+        return obj
 
     @property
-    def bg(self) -> Color:
+    def fg(self) -> Color:
         """
-        Sets the color to background mode.
+        Returns the color in foreground mode.
         """
-        _Ground.check((operator.eq, self, _Ground.NONE, _ALREADY_INITIALIZED))
+        return self._with_ground(_Ground.FORE)
 
-        self._ansi.extend(self._form(_Ground.BACK))
-        self._ground = _Ground.BACK
-
-        return self
+    @property
+    def bg(self) -> Color:
+        """
+        Returns the color in background mode.
+        """
+        return self._with_ground(_Ground.BACK)
 
     def on(self, other: Color) -> Color:
         """
-        Sets the color to foreground mode and adds
+        Returns the color in foreground mode with
         another color as background mode.
 
         Parameters
@@ -260,100 +301,109 @@ class Color(Ansi, metaclass=ABCMeta):
             )
         )
 
-        self = self.fg
-        self.extend(other.bg if other._ground != _Ground.BACK else other)
+        fore = self.fg
+        back = other.bg if other._ground != _Ground.BACK else other
 
-        self._ground = _Ground.BOTH
+        obj: Color = fore._replace(
+            fore._ansi + back._ansi, fore._off + back._off
+        )
+        obj._ground = _Ground.BOTH
 
-        return self
+        return obj
 
     @classmethod
     @abstractmethod
-    def _from_rgb(cls, rgb: T_RGB) -> Color:
+    def _from_rgb(cls, rgb: T_RGB, palette: Optional[Palette] = None) -> Color:
         ...
 
     @classmethod
-    def from_rgb(cls, rgb: T_RGB | tuple[float, float, float]) -> Color:
+    def from_rgb(
+        cls,
+        rgb: T_RGB | tuple[float, float, float],
+        palette: Optional[Palette] = None,
+    ) -> Color:
         """
         Get color from RGB value.
 
-        .. seealso::
+        .. versionchanged:: 0.2.0
+            Added ``palette`` parameter.
 
-           :doc:`Creating Colors <creating-color>`
-        """
-        values: list[int] = []
-        for i in rgb:
-            if isinstance(i, float):
-                i = round(i * 255)
-            values.append(i)
-
-        return cls._from_rgb(values)  # type: ignore
+        Parameters
+        ----------
+        rgb
+            The rgb value. Floats are treated as
+            fractions of ``255``.
 
-    @classmethod
-    def from_name(cls, name: str) -> Color:
-        """
-        Get color from Web Color name.
+        palette
+            A custom palette to choose the color from
+            instead of the built-in one. Only used by
+            colors with a palette (3bit and 8bit).
 
         .. seealso::
 
            :doc:`Creating Colors <creating-color>`
         """
-        return cls.from_rgb(webcolors.COLORS[name.lower()])
+        return cls._from_rgb(_parse_rgb(rgb), palette)
 
     @classmethod
-    def from_hex(cls, hex: HEX) -> Color:
+    def from_name(cls, name: str, palette: Optional[Palette] = None) -> Color:
         """
-        Get color from HEX value.
+        Get color from Web Color name.
+
+        .. versionchanged:: 0.2.0
+            Added ``palette`` parameter (see :meth:`from_rgb`).
 
         .. seealso::
 
            :doc:`Creating Colors <creating-color>`
         """
-        if isinstance(hex, int):
-            # convert to string
-            hex = f"{hex:X}"
+        from . import webcolors
 
-            # leading 0s will be removed so we need
-            # to add them (e. g. 0x0AF -> AF -> 0AF)
-            if len(hex) < 3:
-                hex = hex.zfill(3)
+        return cls._from_web(webcolors.index(name.lower()), palette)
 
-            elif 3 < len(hex) < 6:
-                hex = hex.zfill(6)
+    @classmethod
+    def _from_web(cls, index: int, palette: Optional[Palette] = None) -> Color:
+        """
+        Creates a color from the position of a web
+        color in :data:`adorable.webcolors.NAMES`.
+        """
+        from . import webcolors
 
-        if not isinstance(hex, str):
-            raise TypeError("hex value must be int or str")
+        return cls._from_rgb(webcolors.rgb(index), palette)
 
-        hex = hex.removeprefix("#")
+    @classmethod
+    def from_hex(cls, hex: HEX, palette: Optional[Palette] = None) -> Color:
+        """
+        Get color from HEX value.
 
-        if len(hex) == 3:
-            # convert to a six chars long string
-            hex = "".join(char * 2 for char in hex)
+        .. versionchanged:: 0.2.0
+            Added ``palette`` parameter (see :meth:`from_rgb`).
 
-        elif len(hex) != 6:
-            raise ValueError(
-                "hex value should consist of 3 or 6 characters "
-                "(e. g. `0xFFFFFF` or `0xFFF`)"
-            )
-
-        h = iter(hex)
+        .. seealso::
 
-        rgb = [int(char, 16) * 16 + int(next(h), 16) for char in h]
-        return cls.from_rgb(rgb)  # type: ignore
+           :doc:`Creating Colors <creating-color>`
+        """
+        return cls.from_rgb(_parse_hex(hex), palette)
 
 
 class Color0bit(Color):
+    __slots__ = ()
+
     _termtype: Terminal = Terminal.NOCOLOR
 
     def _form(self, ground: _Ground) -> list[int]:
         return []
 
     @classmethod
-    def _from_rgb(cls, rgb: T_RGB) -> Color0bit:
+    def _from_rgb(
+        cls, rgb: T_RGB, palette: Optional[Palette] = None
+    ) -> Color0bit:
         return cls()
 
 
 class Color3bit(Color):
+    __slots__ = ()
+
     _termtype: Terminal = Terminal.BIT3
 
     def _form(self, ground: _Ground) -> list[int]:
@@ -365,12 +415,38 @@ class Color3bit(Color):
         return [(30 if ground == _Ground.FORE else 40) + value]
 
     @classmethod
-    def _from_rgb(cls, rgb: T_RGB) -> Color3bit:
-        color: int = _get_closest_color(RGB(*rgb), enumerate(_palette.ANSI3BIT))
+    def _from_rgb(
+        cls, rgb: T_RGB, palette: Optional[Palette] = None
+    ) -> Color3bit:
+        if palette is None:
+            color = quantize.quantize_3bit(rgb)
+
+        elif len(palette) > 8:
+            raise ValueError(
+                "3bit palette must not contain more than 8 colors"
+            )
+
+        else:
+            color = palette.closest(rgb)
+
         return cls(ansi=color, rgb=rgb)
 
+    @classmethod
+    def _from_web(
+        cls, index: int, palette: Optional[Palette] = None
+    ) -> Color3bit:
+        from . import webcolors
+
+        # the precomputed indices are the results of the exact mode
+        if palette is not None or quantize.mode != "exact":
+            return cls._from_rgb(webcolors.rgb(index), palette)
+
+        return cls(ansi=webcolors.INDEX3[index], rgb=webcolors.rgb(index))
+
 
 class Color8bit(Color):
+    __slots__ = ()
+
     _termtype: Terminal = Terminal.BIT8
 
     def _form(self, ground: _Ground) -> list[int]:
@@ -382,12 +458,38 @@ class Color8bit(Color):
         return [38 if ground == _Ground.FORE else 48, 5, value]
 
     @classmethod
-    def _from_rgb(cls, rgb: T_RGB) -> Color8bit:
-        color: int = _get_closest_color(RGB(*rgb), enumerate(_palette.ANSI8BIT))
+    def _from_rgb(
+        cls, rgb: T_RGB, palette: Optional[Palette] = None
+    ) -> Color8bit:
+        if palette is None:
+            color = quantize.quantize_8bit(rgb)
+
+        elif len(palette) > 256:
+            raise ValueError(
+                "8bit palette must not contain more than 256 colors"
+            )
+
+        else:
+            color = palette.closest(rgb)
+
         return cls(ansi=color, rgb=rgb)
 
+    @classmethod
+    def _from_web(
+        cls, index: int, palette: Optional[Palette] = None
+    ) -> Color8bit:
+        from . import webcolors
+
+        # the precomputed indices are the results of the exact mode
+        if palette is not None or quantize.mode != "exact":
+            return cls._from_rgb(webcolors.rgb(index), palette)
+
+        return cls(ansi=webcolors.INDEX8[index], rgb=webcolors.rgb(index))
+
 
 class Color24bit(Color):
+    __slots__ = ()
+
     _termtype: Terminal = Terminal.BIT24
 
     def _form(self, ground: _Ground) -> list[int]:
@@ -399,35 +501,297 @@ class Color24bit(Color):
         return [38 if ground == _Ground.FORE else 48, 2, r, g, b]
 
     @classmethod
-    def _from_rgb(cls, rgb: T_RGB) -> Color24bit:
+    def _from_rgb(
+        cls, rgb: T_RGB, palette: Optional[Palette] = None
+    ) -> Color24bit:
         return cls(rgb=rgb)
 
 
-def get_color() -> type[Color]:
-    t = Terminal.get_term([])
-    for colortype in [Color0bit, Color3bit, Color8bit, Color24bit]:
-        if colortype._termtype == t:
-            return colortype
+def _parse_rgb(
+    rgb: T_RGB | tuple[float, float, float],
+) -> tuple[int, int, int]:
+    """
+    Converts floats of an rgb value to integers.
+    """
+    r, g, b = (round(i * 255) if isinstance(i, float) else i for i in rgb)
+    return r, g, b
+
+
+def _parse_hex(hex: HEX) -> tuple[int, int, int]:
+    """
+    Converts a hex value to an rgb value.
+    """
+    if isinstance(hex, int):
+        # convert to string
+        hex = f"{hex:X}"
+
+        # leading 0s will be removed so we need
+        # to add them (e. g. 0x0AF -> AF -> 0AF)
+        if len(hex) < 3:
+            hex = hex.zfill(3)
+
+        elif 3 < len(hex) < 6:
+            hex = hex.zfill(6)
+
+    if not isinstance(hex, str):
+        raise TypeError("hex value must be int or str")
+
+    hex = hex.removeprefix("#")
+
+    if len(hex) == 3:
+        # convert to a six chars long string
+        hex = "".join(char * 2 for char in hex)
+
+    elif len(hex) != 6:
+        raise ValueError(
+            "hex value should consist of 3 or 6 characters "
+            "(e. g. `0xFFFFFF` or `0xFFF`)"
+        )
+
+    h = iter(hex)
+
+    r, g, b = (int(char, 16) * 16 + int(next(h), 16) for char in h)
+    return r, g, b
+
+
+_ColorType = Union[
+    type[Color0bit], type[Color3bit], type[Color8bit], type[Color24bit]
+]
+"""Concrete color class."""
+
+_COLOR_TYPES: dict[Terminal, _ColorType] = {
+    Terminal.NOCOLOR: Color0bit,
+    Terminal.BIT3: Color3bit,
+    Terminal.BIT8: Color8bit,
+    Terminal.BIT24: Color24bit,
+}
+
+
+def get_color(stream: Optional[TextIO] = None) -> type[Color]:
+    """
+    Returns the color class of the current color
+    system.
+
+    Parameters
+    ----------
+    stream
+        .. versionadded:: 0.2.0
+
+        Use the color system of the terminal of this
+        stream instead (see
+        :meth:`adorable.term.Terminal.for_stream`).
+    """
+    if stream is not None:
+        return _COLOR_TYPES[Terminal.for_stream(stream)]
+
+    return _COLOR_TYPES[Terminal.get_term([])]
+
+
+@lru_cache(maxsize=1024)
+def _intern(
+    colortype: type[Color],
+    key: tuple[int, int, int] | str,
+    palette: Optional[Palette],
+    mode: str,
+) -> Color:
+    """
+    Returns the shared uninitialized color of an rgb
+    value or a lowercase web color name.
+
+    The quantization ``mode`` is part of the key, so
+    changing :data:`adorable.quantize.mode` does not
+    return stale colors.
+    """
+    if isinstance(key, str):
+        from . import webcolors
+
+        return colortype._from_web(webcolors.index(key), palette)
+
+    return colortype._from_rgb(key, palette)
+
+
+_STREAM_NOTE: dict[re.Pattern[str], str] = {
+    re.compile(r"(?<=\S)\s*\Z"): """
+
+        .. versionchanged:: 0.2.0
+            Added ``stream`` parameter. The color is created
+            for the color system of the terminal of this
+            stream (see :func:`get_color`).
+        """
+}
+
+
+@_copydoc(Color.from_hex, replace=_STREAM_NOTE)
+def from_hex(
+    hex: HEX,
+    palette: Optional[Palette] = None,
+    stream: Optional[TextIO] = None,
+) -> Color:
+    rgb = _parse_hex(hex)
+    return _intern(get_color(stream), rgb, palette, quantize.mode)
 
-    return Color0bit  # unreachable
 
+@_copydoc(Color.from_rgb, replace=_STREAM_NOTE)
+def from_rgb(
+    rgb: T_RGB | tuple[float, float, float],
+    palette: Optional[Palette] = None,
+    stream: Optional[TextIO] = None,
+) -> Color:
+    rgb = _parse_rgb(rgb)
+    return _intern(get_color(stream), rgb, palette, quantize.mode)
 
-@_copydoc(Color.from_hex)
-def from_hex(*args: Any, **kwargs: Any) -> Color:
-    col = get_color()
-    return col.from_hex(*args, **kwargs)
 
+@_copydoc(Color.from_name, replace=_STREAM_NOTE)
+def from_name(
+    name: str,
+    palette: Optional[Palette] = None,
+    stream: Optional[TextIO] = None,
+) -> Color:
+    return _intern(get_color(stream), name.lower(), palette, quantize.mode)
 
-@_copydoc(Color.from_rgb)
-def from_rgb(*args: Any, **kwargs: Any) -> Color:
-    col = get_color()
-    return col.from_rgb(*args, **kwargs)
 
+def cache_info() -> Any:
+    """
+    .. versionadded:: 0.2.0
+
+    Returns statistics of the cache used by
+    :func:`from_rgb`, :func:`from_hex` and
+    :func:`from_name`.
+
+    The cache maps the color system and the rgb value
+    (or web color name) onto the quantized color, so the same color is
+    only quantized once per color system. Changing
+    the color system (e.g. via :func:`adorable.use`)
+    never returns colors of the previous one. Since
+    colors are immutable, equal requests share the
+    same object.
+
+    .. seealso::
+
+       :pylib:`functools.lru_cache`
+    """
+    return _intern.cache_info()
+
+
+def cache_clear() -> None:
+    """
+    .. versionadded:: 0.2.0
+
+    Clears the cache used by :func:`from_rgb`,
+    :func:`from_hex` and :func:`from_name`.
+    """
+    _intern.cache_clear()
+
+
+def quantize_many(
+    colors: Iterable[T_RGB], terminal: Optional[Terminal] = None
+) -> Sequence[int]:
+    """
+    .. versionadded:: 0.2.0
+
+    Returns the palette index of many rgb values at
+    once. The indices equal those of :func:`from_rgb`
+    for the strategy set in
+    :data:`adorable.quantize.mode`. With ``"exact"``
+    the distances are computed vectorized when NumPy
+    is installed.
+
+    .. seealso::
+
+       :func:`adorable.quantize.nearest_many`
+
+    Parameters
+    ----------
+    colors
+        The rgb values such as an array of shape
+        ``(N, 3)`` and type ``uint8``.
+
+    terminal
+        The color system whose palette is used. Must be
+        :attr:`Terminal.BIT3` or :attr:`Terminal.BIT8`.
+        Defaults to the current color system.
+
+    Raises
+    ------
+    ``ValueError``
+        The color system has no palette.
+
+    Returns
+    -------
+    The palette indices. This is an array if NumPy is
+    installed and a list otherwise.
+    """
+    if terminal is None:
+        terminal = Terminal.get_term([])
+
+    if terminal == Terminal.BIT3:
+        if quantize.mode == "exact":
+            return quantize.nearest_many(colors, _palette.ANSI3BIT)
+        return quantize._quantize_each(colors, quantize.quantize_3bit)
+
+    if terminal == Terminal.BIT8:
+        if quantize.mode == "exact":
+            return quantize.nearest_many(colors, _palette.ANSI8BIT)
+        return quantize._quantize_each(colors, quantize.quantize_8bit)
+
+    raise ValueError(f"color system {terminal.name} has no palette")
+
+
+def render_many(
+    colors: Iterable[T_RGB],
+    terminal: Optional[Terminal] = None,
+    background: bool = False,
+) -> list[str]:
+    """
+    .. versionadded:: 0.2.0
+
+    Returns the escape sequence of many rgb values at
+    once. Each sequence equals the one returned by
+    :meth:`Color.enable_str` of the matching color.
+
+    Parameters
+    ----------
+    colors
+        The rgb values such as an array of shape
+        ``(N, 3)`` and type ``uint8``.
+
+    terminal
+        The color system to use. Defaults to the current
+        color system.
+
+    background
+        Whether to set the background instead of the
+        foreground color.
+    """
+    if terminal is None:
+        terminal = Terminal.get_term([])
+
+    ground = _Ground.BACK if background else _Ground.FORE
+
+    if terminal in (Terminal.BIT3, Terminal.BIT8):
+        colortype = Color3bit if terminal == Terminal.BIT3 else Color8bit
+        if terminal == Terminal.BIT3:
+            palette = _palette.ANSI3BIT
+        else:
+            palette = _palette.ANSI8BIT
+        sequences = [
+            _get_ansi_string(*colortype(ansi=i)._form(ground))
+            for i in range(len(palette))
+        ]
+        indices = quantize_many(colors, terminal)
+        if not isinstance(indices, list):
+            indices = indices.tolist()  # type: ignore[attr-defined]
+        return [sequences[i] for i in indices]
+
+    if terminal == Terminal.BIT24:
+        return [
+            _get_ansi_string(
+                *Color24bit(rgb=tuple(map(int, rgb)))._form(ground)
+            )
+            for rgb in colors
+        ]
 
-@_copydoc(Color.from_name)
-def from_name(*args: Any, **kwargs: Any) -> Color:
-    col = get_color()
-    return col.from_name(*args, **kwargs)
+    return [_get_ansi_string() for _ in colors]
 
 
 def empty() -> Color0bit:
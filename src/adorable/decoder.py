@@ -0,0 +1,284 @@
+"""
+.. versionadded:: 0.2.0
+
+Decoding of styled text back into :class:`adorable.Text`.
+
+Output of other programs often contains colors that the
+terminal does not support. The :class:`AnsiDecoder` turns
+such output into spans of colors and attributes and
+renders it again for the color system of the terminal.
+"""
+
+from __future__ import annotations
+
+__all__ = ["AnsiDecoder"]
+
+from array import array
+from functools import lru_cache, reduce
+import operator
+import re
+from sys import stdout
+from typing import Optional, TextIO
+
+from . import _palette, style as _style
+from .ansi import Ansi
+from .color import Color, Color3bit, Color8bit, Color24bit
+from .encoder import Encoder, SGRState, _DEFAULT, _downgrade_color
+from .measure import ANSI_PATTERN
+from .term import Terminal
+from .text import Text
+
+
+_SEQUENCE: re.Pattern[str] = re.compile(
+    # SGR sequences capture their parameters
+    r"\x1b\[([0-9;]*)m|" + ANSI_PATTERN.pattern
+)
+"""Regex pattern that matches ansi escape sequences."""
+
+_ATTRIBUTES: dict[int, Ansi] = {
+    style._ansi[0]: style
+    for style in (
+        _style.BOLD,
+        _style.DIM,
+        _style.ITALIC,
+        _style.UNDERLINE,
+        _style.BLINK,
+        _style.INVERSE,
+        _style.INVISIBLE,
+        _style.STRIKETHROUGH,
+    )
+}
+"""Styles of :mod:`adorable.style` by their parameter."""
+
+_COLORS_LIMIT: int = 4096
+"""Maximum number of colors in the cache of a decoder."""
+
+
+def _color(params: tuple[int, ...]) -> Optional[Color]:
+    """
+    Returns the color that SGR parameters set or
+    ``None`` if the parameters are invalid.
+    """
+    first = params[0]
+
+    if first in (38, 48):
+        if params[1] == 5 and 0 <= params[2] <= 255:
+            index = params[2]
+            color: Color = Color8bit(ansi=index, rgb=_palette.ANSI8BIT[index])
+        elif params[1] == 2 and all(0 <= value <= 255 for value in params[2:]):
+            color = Color24bit(rgb=params[2:])
+        else:
+            return None
+        return color.fg if first == 38 else color.bg
+
+    # 30-37, 40-47 and the bright variants 90-97 and 100-107
+    value = first % 10
+    if first >= 90:
+        color = Color8bit(ansi=value + 8, rgb=_palette.ANSI8BIT[value + 8])
+    else:
+        color = Color3bit(ansi=value, rgb=_palette.ANSI3BIT[value])
+    return color.fg if first < 40 or 90 <= first < 100 else color.bg
+
+
+@lru_cache(maxsize=1024)
+def _state_style(state: SGRState) -> Optional[Ansi]:
+    """
+    Returns the style of a state or ``None`` if the
+    state has no valid style.
+    """
+    parts = [_ATTRIBUTES[value] for value in sorted(state.attributes)]
+    for params in (state.fg, state.bg):
+        color = _color(params) if params is not None else None
+        if color is not None:
+            parts.append(color)
+
+    if not parts:
+        return None
+
+    return reduce(operator.add, parts)
+
+
+class AnsiDecoder:
+    """
+    Turns styled text into :class:`adorable.Text` and
+    renders it for a color system.
+
+    SGR sequences are read into colors of
+    :mod:`adorable.color` and the styles of
+    :mod:`adorable.style`. Other escape sequences are
+    removed. The style at the end of a string applies to
+    the next string, so a stream can be decoded line by
+    line.
+
+    Every distinct color is quantized only once per
+    decoder. Use one decoder per stream.
+
+    Examples
+    --------
+    .. code-block::
+
+       decoder = AnsiDecoder(Terminal.BIT8)
+       for line in process.stdout:
+           sys.stdout.write(decoder.recode(line))
+       sys.stdout.write(decoder.close())
+
+    Parameters
+    ----------
+    terminal
+        The color system to render for. Defaults to the
+        color system of ``stream``.
+
+    stream
+        The stream the output is written to. Defaults to
+        standard output.
+    """
+
+    def __init__(
+        self,
+        terminal: Optional[Terminal] = None,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        if terminal is None:
+            terminal = Terminal.for_stream(stream or stdout)
+
+        self.terminal = terminal
+        """The color system to render for."""
+
+        self.state: SGRState = _DEFAULT
+        """The style after the text decoded so far."""
+
+        self._encoder = Encoder()
+        self._colors: dict[tuple[int, ...], Optional[tuple[int, ...]]] = {}
+
+    def decode(self, text: str) -> Text:
+        """
+        Returns the styled text as :class:`adorable.Text`.
+
+        Parameters
+        ----------
+        text
+            The styled text.
+        """
+        spans = _Spans()
+        position = 0
+        state = self.state
+
+        for match in _SEQUENCE.finditer(text):
+            if match.start() > position:
+                spans.append(text[position:match.start()], state)
+            position = match.end()
+
+            params = match.group(1)
+            if params is not None:
+                state = state.apply(params.split(";"))
+
+        if position < len(text):
+            spans.append(text[position:], state)
+
+        self.state = state
+        return Text._new(
+            "".join(spans.plain),
+            spans.starts,
+            spans.ends,
+            spans.ids,
+            tuple(spans.styles),
+        )
+
+    def recode(self, text: str) -> str:
+        """
+        Returns the styled text with colors of the color
+        system of the decoder.
+
+        The style is not disabled at the end. Call
+        :meth:`close` after the last text.
+
+        Parameters
+        ----------
+        text
+            The styled text.
+        """
+        return "".join(
+            self._encoder.write(part, self._downgrade(state))
+            for part, state in self.decode(text).segments()
+        )
+
+    def close(self) -> str:
+        """
+        Returns the escape sequence that resets the
+        terminal after the recoded text.
+        """
+        self.state = _DEFAULT
+        return self._encoder.close()
+
+    def _downgrade(self, state: SGRState) -> SGRState:
+        """
+        Returns the state with the colors of the color
+        system. Colors are looked up in the cache of the
+        decoder and quantized on the first use.
+        """
+        if self.terminal == Terminal.BIT24 or state == _DEFAULT:
+            return state
+
+        fg, bg, attributes = state
+        if fg is not None:
+            fg = self._quantize(fg)
+        if bg is not None:
+            bg = self._quantize(bg)
+        return SGRState(fg, bg, attributes)
+
+    def _quantize(self, color: tuple[int, ...]) -> Optional[tuple[int, ...]]:
+        """
+        Returns a color with the color system of the
+        decoder. The cache is cleared when it is full.
+        """
+        colors = self._colors
+        if color not in colors:
+            if len(colors) >= _COLORS_LIMIT:
+                colors.clear()
+            colors[color] = _downgrade_color(color, self.terminal)
+        return colors[color]
+
+
+class _Spans:
+    """
+    The plain text, spans and style table of a
+    :class:`adorable.Text` that is being decoded.
+    """
+
+    def __init__(self) -> None:
+        self.plain: list[str] = []
+        self.length = 0
+        self.starts = array("l")
+        self.ends = array("l")
+        self.ids = array("L")
+        self.styles: list[Ansi] = []
+        self._ids: dict[SGRState, Optional[int]] = {}
+
+    def append(self, part: str, state: SGRState) -> None:
+        """
+        Appends text in a style. A span of the same
+        style that ends where the text starts is
+        extended.
+        """
+        self.plain.append(part)
+        start = self.length
+        self.length += len(part)
+
+        try:
+            id_ = self._ids[state]
+        except KeyError:
+            style = _state_style(state)
+            id_ = None
+            if style is not None:
+                id_ = len(self.styles)
+                self.styles.append(style)
+            self._ids[state] = id_
+
+        if id_ is not None:
+            ids = self.ids
+            if ids and ids[-1] == id_ and self.ends[-1] == start:
+                self.ends[-1] = self.length
+            else:
+                self.starts.append(start)
+                self.ends.append(self.length)
+                ids.append(id_)
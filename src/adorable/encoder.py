@@ -0,0 +1,346 @@
+"""
+.. versionadded:: 0.2.0
+
+Encoding of styled text with as few escape
+sequences as possible.
+
+Instead of enabling and fully disabling the style
+of every span, the :class:`Encoder` keeps track of
+the current SGR state (foreground, background and
+the attributes of :mod:`adorable.style`) and only
+emits the parameters needed to go from one state
+to the next.
+"""
+
+from __future__ import annotations
+
+__all__ = ["SGRState", "Encoder"]
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from sys import stdout
+from typing import Any, NamedTuple, Optional, TextIO, Union
+
+from . import _palette, quantize
+from .ansi import Ansi, _get_ansi_string
+from .term import Terminal
+from .utils import T_RGB
+
+
+_ATTRIBUTE_OFF: dict[int, int] = {
+    1: 22,
+    2: 22,
+    3: 23,
+    4: 24,
+    5: 25,
+    7: 27,
+    8: 28,
+    9: 29,
+}
+"""Parameters that enable an attribute and the ones that disable it."""
+
+_ATTRIBUTES_OF: dict[int, frozenset[int]] = {
+    22: frozenset({1, 2}),
+    23: frozenset({3}),
+    24: frozenset({4}),
+    25: frozenset({5}),
+    27: frozenset({7}),
+    28: frozenset({8}),
+    29: frozenset({9}),
+}
+"""Parameters that disable attributes and the attributes they disable."""
+
+
+class SGRState(NamedTuple):
+    """
+    The graphic rendition of a terminal.
+
+    Attributes
+    ----------
+    fg
+        Parameters that set the foreground color
+        (e.g. ``(38, 5, 9)``) or ``None`` for the
+        default color.
+
+    bg
+        Parameters that set the background color or
+        ``None`` for the default color.
+
+    attributes
+        Enabled attributes such as ``1`` for bold.
+    """
+
+    fg: Optional[tuple[int, ...]] = None
+    bg: Optional[tuple[int, ...]] = None
+    attributes: frozenset[int] = frozenset()
+
+    @classmethod
+    def from_ansi(cls, ansi: Optional[Ansi]) -> SGRState:
+        """
+        Returns the state a terminal is in after
+        enabling ``ansi`` on a reset terminal.
+        """
+        if ansi is None:
+            return _DEFAULT
+
+        return _DEFAULT.apply(ansi._ansi)
+
+    def apply(self, params: Iterable[Any]) -> SGRState:
+        """
+        Returns the state after applying SGR parameters.
+        Unknown parameters are ignored.
+
+        Parameters
+        ----------
+        params
+            The parameters, e.g. ``(38, 5, 9)``. Strings
+            are converted to integers.
+        """
+        return _apply(self, tuple(params))
+
+    def params(self) -> tuple[int, ...]:
+        """
+        Returns the parameters that reach this state
+        from a reset terminal.
+        """
+        return (*sorted(self.attributes), *(self.fg or ()), *(self.bg or ()))
+
+    def transition(self, target: SGRState) -> str:
+        """
+        Returns the shortest escape sequence that changes
+        this state into ``target``.
+        """
+        return _transition(self, target)
+
+    def downgrade(self, terminal: Terminal) -> SGRState:
+        """
+        Returns the state with colors that the color
+        system supports. Colors are mapped onto the
+        closest supported color. ``Terminal.NOCOLOR``
+        removes all colors.
+
+        Parameters
+        ----------
+        terminal
+            The color system.
+        """
+        if terminal == Terminal.BIT24:
+            return self
+
+        return _downgrade(self, terminal)
+
+
+_DEFAULT = SGRState()
+
+
+def _downgrade_color(
+    color: Optional[tuple[int, ...]], terminal: Terminal
+) -> Optional[tuple[int, ...]]:
+    if color is None or terminal == Terminal.NOCOLOR:
+        return None
+
+    if color[0] not in (38, 48) or len(color) < 3:
+        return color
+
+    if color[1] == 2:
+        r, g, b = color[2:5]
+        if terminal == Terminal.BIT8:
+            return (color[0], 5, quantize.quantize_8bit((r, g, b)))
+        rgb: T_RGB = (r, g, b)
+
+    elif terminal == Terminal.BIT3 and 0 <= color[2] <= 255:
+        rgb = _palette.ANSI8BIT[color[2]]
+
+    else:
+        return color
+
+    # 30-37 and 40-47
+    return (color[0] - 8 + quantize.quantize_3bit(rgb),)
+
+
+@lru_cache(maxsize=1024)
+def _downgrade(state: SGRState, terminal: Terminal) -> SGRState:
+    fg = _downgrade_color(state.fg, terminal)
+    bg = _downgrade_color(state.bg, terminal)
+    return SGRState(fg, bg, state.attributes)
+
+
+@lru_cache(maxsize=1024)
+def _apply(state: SGRState, params: tuple[Any, ...]) -> SGRState:
+    fg, bg, attributes = state
+    enabled = set(attributes)
+
+    values = iter(int(param) if param != "" else 0 for param in params)
+    for value in values:
+        if value == 0:
+            fg = bg = None
+            enabled.clear()
+
+        elif value in _ATTRIBUTE_OFF:
+            enabled.add(value)
+
+        elif value in _ATTRIBUTES_OF:
+            enabled -= _ATTRIBUTES_OF[value]
+
+        elif 30 <= value <= 37 or 90 <= value <= 97:
+            fg = (value,)
+
+        elif 40 <= value <= 47 or 100 <= value <= 107:
+            bg = (value,)
+
+        elif value == 39:
+            fg = None
+
+        elif value == 49:
+            bg = None
+
+        elif value in (38, 48):
+            mode = next(values, None)
+            if mode == 5:
+                color: Optional[tuple[int, ...]] = (value, 5, next(values, 0))
+            elif mode == 2:
+                rgb = (next(values, 0), next(values, 0), next(values, 0))
+                color = (value, 2, *rgb)
+            else:
+                continue
+
+            if value == 38:
+                fg = color
+            else:
+                bg = color
+
+    return SGRState(fg, bg, frozenset(enabled))
+
+
+@lru_cache(maxsize=4096)
+def _transition(state: SGRState, target: SGRState) -> str:
+    if state == target:
+        return ""
+
+    if target == _DEFAULT:
+        return _get_ansi_string(0)
+
+    params: list[int] = []
+    added = set(target.attributes - state.attributes)
+
+    removed = state.attributes - target.attributes
+    for off in sorted({_ATTRIBUTE_OFF[a] for a in removed}):
+        params.append(off)
+        # a parameter such as 22 may disable more than needed
+        added |= _ATTRIBUTES_OF[off] & target.attributes
+
+    params.extend(sorted(added))
+
+    if state.fg != target.fg:
+        params.extend(target.fg or (39,))
+
+    if state.bg != target.bg:
+        params.extend(target.bg or (49,))
+
+    reset = (0, *target.params())
+    if len(";".join(map(str, reset))) < len(";".join(map(str, params))):
+        return _get_ansi_string(*reset)
+
+    return _get_ansi_string(*params)
+
+
+class Encoder:
+    """
+    Encodes styled text while keeping track of the
+    current SGR state.
+
+    Text written with the same style as the text
+    before it is not preceded by any escape sequence.
+    Call :meth:`close` after the last text to reset
+    the terminal.
+
+    Examples
+    --------
+    .. code-block::
+
+       from adorable import BOLD, paint
+       from adorable.encoder import Encoder
+
+       encoder = Encoder()
+       text = paint("a", style=BOLD, encoder=encoder)
+       text += paint("b", style=BOLD, encoder=encoder)
+       text += encoder.close()
+       # text == "\\x1b[1mab\\x1b[0m"
+    """
+
+    __slots__ = ("state",)
+
+    def __init__(self) -> None:
+        self.state: SGRState = _DEFAULT
+        """The state after the text returned so far."""
+
+    def write(
+        self, text: str, style: Union[Ansi, SGRState, None] = None
+    ) -> str:
+        """
+        Returns ``text`` preceded by the escape sequence
+        that is needed to show it in ``style``.
+
+        Empty text is skipped without changing the state.
+
+        Parameters
+        ----------
+        text
+            The text to encode.
+
+        style
+            The style of the text. ``None`` means no style.
+        """
+        if not text:
+            return text
+
+        if isinstance(style, SGRState):
+            target = style
+        else:
+            target = SGRState.from_ansi(style)
+        sequence = _transition(self.state, target)
+        self.state = target
+        return sequence + text
+
+    def close(self) -> str:
+        """
+        Returns the escape sequence that resets the
+        terminal if the current state is not the
+        default one.
+        """
+        sequence = _transition(self.state, _DEFAULT)
+        self.state = _DEFAULT
+        return sequence
+
+    @contextmanager
+    def using(
+        self, style: Ansi, file: Optional[TextIO] = None
+    ) -> Iterator[None]:
+        """
+        Enables an ansi style within a block on top of
+        the current state.
+
+        Unlike ``with style:`` leaving the block only
+        restores the previous state instead of fully
+        disabling the style.
+
+        Parameters
+        ----------
+        style
+            The ansi style to apply.
+
+        file
+            File to write to. Defaults to standard output.
+        """
+        file = file or stdout
+        previous = self.state
+
+        self.state = previous.apply(style._ansi)
+        file.write(_transition(previous, self.state))
+        try:
+            yield
+
+        finally:
+            file.write(_transition(self.state, previous))
+            self.state = previous
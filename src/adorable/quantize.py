@@ -0,0 +1,470 @@
+"""
+.. versionadded:: 0.2.0
+
+Utilities for mapping rgb values onto the colors
+of a palette.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "Palette",
+    "LookupTable",
+    "ANSI3BIT_TABLE",
+    "ANSI8BIT_TABLE",
+    "closest_8bit",
+    "quantize_3bit",
+    "quantize_8bit",
+    "nearest_many",
+]
+
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from types import ModuleType
+from typing import Any, Optional, cast
+
+from . import _palette
+from .utils import RGB, T_RGB
+
+
+_LUT_SIZE: int = 32**3
+"""Number of cells of a lookup table (5 bits per channel)."""
+
+_CHUNK_SIZE: int = 4096
+"""Number of colors compared at once by the NumPy backend."""
+
+_CUBE_LEVELS: tuple[int, ...] = (0, 95, 135, 175, 215, 255)
+"""Channel values of the 6x6x6 color cube (indices 16-231)."""
+
+mode: str = "exact"
+"""
+Strategy used for quantizing colors.
+
+``"exact"``
+    Find the closest color of the palette
+    (default). 8bit colors are computed via
+    :func:`closest_8bit`. On ties, the color with
+    the lowest index is used.
+
+``"cube"``
+    Compute the closest 8bit color via
+    :func:`closest_8bit`. 3bit colors are
+    looked up like in ``"table"``.
+
+``"table"``
+    Use a :class:`LookupTable`. Results are
+    approximated within a cell of the table and
+    are not always the closest color.
+"""
+
+
+def _nearest(color: T_RGB, colors: Sequence[T_RGB]) -> int:
+    """
+    Returns the index of the color in ``colors`` with
+    the smallest euclidean distance to ``color``. The
+    first match wins on ties.
+    """
+    r, g, b = color
+    best = 0
+    best_diff = 3 * 256**2
+    for i, (pr, pg, pb) in enumerate(colors):
+        diff = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
+        if diff < best_diff:
+            best = i
+            best_diff = diff
+
+    return best
+
+
+_Node = tuple[int, int, "Optional[_Node]", "Optional[_Node]"]
+
+
+class Palette(Sequence[RGB]):
+    """
+    A custom color palette.
+
+    The colors are indexed by a k-d tree once, so
+    finding the closest color of a palette with ``n``
+    colors takes ``O(log n)`` on average instead of
+    comparing against every color.
+
+    Examples
+    --------
+    .. code-block::
+
+       from adorable import Color8bit
+       from adorable.quantize import Palette
+
+       theme = Palette([(40, 42, 54), (255, 85, 85), ...])
+       RED = Color8bit.from_name("red", palette=theme).fg
+
+    Parameters
+    ----------
+    colors
+        The rgb values of the palette. The position
+        of a color is its index.
+
+    Raises
+    ------
+    ``ValueError``
+        The palette is empty.
+    """
+
+    __slots__ = ("_colors", "_exact", "_tree")
+
+    def __init__(self, colors: Iterable[T_RGB]) -> None:
+        self._colors = [RGB(*map(int, rgb)) for rgb in colors]
+        if not self._colors:
+            raise ValueError("palette must contain at least one color")
+
+        self._exact: dict[tuple[int, int, int], int] = {}
+        for i, rgb in enumerate(self._colors):
+            self._exact.setdefault(rgb, i)
+
+        self._tree = self._build(list(self._exact.values()), 0)
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._colors[index]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._colors!r})"
+
+    def _build(self, indices: list[int], axis: int) -> Optional[_Node]:
+        """
+        Builds the k-d tree by splitting ``indices`` at
+        their median along ``axis``.
+        """
+        if not indices:
+            return None
+
+        indices.sort(key=lambda i: self._colors[i][axis])
+        median = len(indices) // 2
+        following = (axis + 1) % 3
+
+        return (
+            indices[median],
+            axis,
+            self._build(indices[:median], following),
+            self._build(indices[median + 1:], following),
+        )
+
+    def closest(self, color: T_RGB) -> int:
+        """
+        Returns the index of the palette color closest
+        to ``color``. Colors that appear multiple times
+        map onto their first index.
+
+        Parameters
+        ----------
+        color
+            The rgb value.
+        """
+        r, g, b = color
+        try:
+            return self._exact[r, g, b]
+        except KeyError:
+            pass
+
+        colors = self._colors
+        best = self._tree[0]  # type: ignore[index]
+        pr, pg, pb = colors[best]
+        best_diff = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
+
+        # pairs of a node and the squared distance between
+        # the color and the splitting plane of its parent
+        stack: list[tuple[Optional[_Node], int]] = [(self._tree, 0)]
+        while stack:
+            node, bound = stack.pop()
+            if node is None or bound > best_diff:
+                continue
+
+            i, axis, left, right = node
+            pr, pg, pb = colors[i]
+            diff = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
+            if diff < best_diff or diff == best_diff and i < best:
+                best = i
+                best_diff = diff
+
+            delta = color[axis] - colors[i][axis]
+            near, far = (left, right) if delta < 0 else (right, left)
+            stack.append((far, delta * delta))
+            stack.append((near, 0))
+
+        return best
+
+
+class LookupTable:
+    """
+    Reduced-resolution lookup table that maps rgb
+    values onto the closest palette index.
+
+    The rgb cube is divided into ``32x32x32`` cells.
+    Each cell stores the index of the palette color
+    closest to its center. Cells are filled on first
+    use, so creating a table is cheap and every query
+    after the first one for a cell costs O(1).
+
+    Colors that are part of the palette always map
+    onto their own (first) index.
+
+    Parameters
+    ----------
+    colors
+        The rgb values of the palette. The position
+        of a color is its index.
+
+    nearest
+        Callable that returns the index of the closest
+        palette color of an rgb value. It is used to
+        fill the cells. Defaults to comparing against
+        every color of the palette.
+    """
+
+    __slots__ = ("_colors", "_exact", "_cells", "_nearest")
+
+    def __init__(
+        self,
+        colors: Sequence[T_RGB],
+        nearest: Optional[Callable[[T_RGB], int]] = None,
+    ) -> None:
+        if not 0 < len(colors) <= 256:
+            raise ValueError("palette must contain between 1 and 256 colors")
+
+        self._colors = [RGB(*rgb) for rgb in colors]
+
+        self._exact: dict[tuple[int, int, int], int] = {}
+        for i, rgb in enumerate(self._colors):
+            self._exact.setdefault(rgb, i)
+
+        # -1 marks cells that are not computed yet
+        self._cells = array("h", [-1]) * _LUT_SIZE
+        self._nearest = nearest
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def __call__(self, color: T_RGB) -> int:
+        """
+        Returns the index of the palette color closest
+        to ``color``.
+        """
+        r, g, b = color
+        try:
+            return self._exact[r, g, b]
+        except KeyError:
+            pass
+
+        if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+            return _nearest(color, self._colors)
+
+        key = (r >> 3) << 10 | (g >> 3) << 5 | b >> 3
+
+        value = self._cells[key]
+        if value < 0:
+            value = self._cells[key] = self._fill(r, g, b)
+
+        return value
+
+    def _fill(self, r: int, g: int, b: int) -> int:
+        """
+        Computes the value of the cell containing the
+        given color.
+        """
+        center = (r & ~7 | 4, g & ~7 | 4, b & ~7 | 4)
+        if self._nearest is not None:
+            return self._nearest(center)
+
+        return _nearest(center, self._colors)
+
+
+_ANSI8BIT_SYSTEM: list[tuple[int, RGB]] = list(
+    enumerate(_palette.ANSI8BIT[:16])
+)
+"""The 16 system colors. Some of them are also part of the cube."""
+
+
+def closest_8bit(color: T_RGB) -> int:
+    """
+    Returns the index of the closest 8bit color.
+
+    Instead of comparing against all 256 colors, the
+    closest color of the 6x6x6 cube and the closest
+    step of the gray ramp are computed directly. The
+    better of both is then compared against the 16
+    system colors.
+
+    The result is the same as comparing against every
+    color: the closest color and the first index on
+    ties.
+
+    Parameters
+    ----------
+    color
+        The rgb value.
+    """
+    r, g, b = color
+
+    # closest cube cell, channel by channel (the lower level on ties)
+    cr = 0 if r < 48 else 1 if r <= 115 else min((r - 36) // 40, 5)
+    cg = 0 if g < 48 else 1 if g <= 115 else min((g - 36) // 40, 5)
+    cb = 0 if b < 48 else 1 if b <= 115 else min((b - 36) // 40, 5)
+    lr, lg, lb = _CUBE_LEVELS[cr], _CUBE_LEVELS[cg], _CUBE_LEVELS[cb]
+    best = 16 + 36 * cr + 6 * cg + cb
+    best_diff = (r - lr) ** 2 + (g - lg) ** 2 + (b - lb) ** 2
+
+    # closest gray step (8, 18, ..., 238) to the mean of the channels
+    step = min(max((r + g + b - 10) // 30, 0), 23)
+    level = 8 + 10 * step
+    diff = (r - level) ** 2 + (g - level) ** 2 + (b - level) ** 2
+    if diff < best_diff:
+        best = 232 + step
+        best_diff = diff
+
+    for i, (pr, pg, pb) in _ANSI8BIT_SYSTEM:
+        diff = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
+        if diff < best_diff or diff == best_diff and i < best:
+            best = i
+            best_diff = diff
+
+    return best
+
+
+ANSI3BIT_TABLE = LookupTable(_palette.ANSI3BIT)
+"""Lookup table of the 3bit color palette."""
+
+ANSI8BIT_TABLE = LookupTable(_palette.ANSI8BIT, closest_8bit)
+"""Lookup table of the 8bit color palette."""
+
+
+def quantize_3bit(color: T_RGB) -> int:
+    """
+    Returns the index of the closest 3bit color
+    using the strategy set in :data:`mode`.
+    """
+    if mode == "exact":
+        return _nearest(color, _palette.ANSI3BIT)
+
+    if mode in ("table", "cube"):
+        return ANSI3BIT_TABLE(color)
+
+    raise ValueError(f"unknown quantization mode {mode!r}")
+
+
+def quantize_8bit(color: T_RGB) -> int:
+    """
+    Returns the index of the closest 8bit color
+    using the strategy set in :data:`mode`.
+    """
+    if mode in ("exact", "cube"):
+        return closest_8bit(color)
+
+    if mode == "table":
+        return ANSI8BIT_TABLE(color)
+
+    raise ValueError(f"unknown quantization mode {mode!r}")
+
+
+def _numpy() -> Optional[ModuleType]:
+    """
+    Returns the ``numpy`` module or ``None`` if it
+    is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def nearest_many(
+    colors: Iterable[T_RGB], palette: Sequence[T_RGB]
+) -> Sequence[int]:
+    """
+    Returns the index of the closest palette color
+    for each rgb value.
+
+    When NumPy is installed, the distances are computed
+    vectorized and an array is returned. Its type is
+    ``uint8`` for palettes of up to 256 colors and
+    ``intp`` otherwise. Without NumPy a list is
+    returned.
+
+    Unlike :func:`quantize_3bit` and :func:`quantize_8bit`
+    this function ignores :data:`mode` and always finds
+    the closest color.
+
+    Parameters
+    ----------
+    colors
+        The rgb values. This may be an array of shape
+        ``(N, 3)`` or any other iterable.
+
+    palette
+        The rgb values of the palette. The position
+        of a color is its index.
+    """
+    np = _numpy()
+    if np is None:
+        return _nearest_many_python(colors, palette)
+
+    if not isinstance(colors, np.ndarray):
+        # generators cannot be converted to an array directly
+        colors = list(colors)
+    values = np.asarray(colors, dtype=np.int32).reshape(-1, 3)
+    if isinstance(palette, _palette.PackedPalette):
+        pal = np.frombuffer(palette.data, dtype=np.uint8).astype(np.int32)
+    else:
+        pal = np.asarray(list(palette), dtype=np.int32)
+    pal = pal.reshape(-1, 3)
+
+    # |c - p|^2 = |c|^2 - 2 c.p + |p|^2 where |c|^2 does not
+    # change the order of a row
+    squared = (pal**2).sum(axis=1)
+    dtype = np.uint8 if len(pal) <= 256 else np.intp
+    result = np.empty(len(values), dtype=dtype)
+    for start in range(0, len(values), _CHUNK_SIZE):
+        chunk = values[start:start + _CHUNK_SIZE]
+        diffs = squared - 2 * (chunk @ pal.T)
+        result[start:start + _CHUNK_SIZE] = diffs.argmin(axis=1)
+
+    return cast(Sequence[int], result)
+
+
+def _nearest_many_python(
+    colors: Iterable[T_RGB], palette: Sequence[T_RGB]
+) -> list[int]:
+    """
+    Pure Python fallback of :func:`nearest_many`.
+    """
+    nearest: Callable[[Any], int]
+    if palette is _palette.ANSI8BIT:
+        nearest = closest_8bit
+    elif isinstance(palette, Palette):
+        nearest = palette.closest
+    else:
+        nearest = lambda color: _nearest(color, palette)  # noqa: E731
+
+    return _quantize_each(colors, nearest)
+
+
+def _quantize_each(
+    colors: Iterable[T_RGB], quantize: Callable[[Any], int]
+) -> list[int]:
+    """
+    Returns ``quantize`` of each rgb value. Every
+    distinct value is quantized only once.
+    """
+    memo: dict[tuple[int, int, int], int] = {}
+    result = []
+    for r, g, b in colors:
+        key = (int(r), int(g), int(b))
+        value = memo.get(key)
+        if value is None:
+            value = memo[key] = quantize(key)
+        result.append(value)
+
+    return result
@@ -8,9 +8,11 @@ from .ansi import Ansi
 
 
 class Style(Ansi):
+    __slots__ = ()
+
     def __init__(self, enable: Any, disable: Any):
-        self._ansi = [enable]
-        self._off = [disable]
+        self._ansi = (enable,)
+        self._off = (disable,)
 
 
 BOLD = Style(1, 22)  # b
@@ -11,10 +11,11 @@ your project.
 
 from __future__ import annotations
 
-from functools import cache
+from collections.abc import Mapping
+from functools import cache, lru_cache
 from pathlib import Path
 from types import ModuleType
-from typing import Union
+from typing import Optional, Union
 
 from .ansi import Ansi
 
@@ -25,6 +26,111 @@ _globals: dict[str, Ansi] = dict()
 _loaded: set[ModuleType] = set()
 """Loaded stylesheet modules."""
 
+_version: int = 0
+"""
+.. versionadded:: 0.2.0
+
+Incremented whenever styles are loaded or removed.
+Caches of the loaded styles compare it to the version
+they were built with.
+"""
+
+_sequences: dict[str, tuple[str, str]] = dict()
+"""Escape sequences of the loaded styles by name."""
+
+_sequences_version: int = 0
+"""Version of :data:`_globals` that ``_sequences`` belongs to."""
+
+
+def _changed() -> None:
+    """
+    Invalidates the caches of the loaded styles.
+    """
+    global _version
+    _version += 1
+
+
+@lru_cache(maxsize=1024)
+def _get_sequences(ansi: Ansi) -> tuple[str, str]:
+    """
+    Returns the enabling and disabling escape sequence
+    of an ansi object. Ansi objects are immutable, so
+    they are only computed once.
+    """
+    return ansi.enable_str(), ansi.disable_str()
+
+
+def get_style(name: str, style: Optional[Mapping[str, Ansi]] = None) -> Ansi:
+    """
+    .. versionadded:: 0.2.0
+
+    Returns a style by its name.
+
+    Parameters
+    ----------
+    name
+        The name of the style object.
+
+    style
+        Styles that take precedence over the loaded
+        ones.
+
+    Raises
+    ------
+    ``KeyError``
+        There is no style with this name.
+    """
+    if style:
+        ansi = style.get(name)
+        if ansi is not None:
+            return ansi
+
+    return _globals[name]
+
+
+def get_sequences(
+    name: str, style: Optional[Mapping[str, Ansi]] = None
+) -> tuple[str, str]:
+    """
+    .. versionadded:: 0.2.0
+
+    Returns the enabling and disabling escape sequence
+    of a style by its name.
+
+    The escape sequences of loaded styles are cached
+    until styles are loaded or removed.
+
+    Parameters
+    ----------
+    name
+        The name of the style object.
+
+    style
+        Styles that take precedence over the loaded
+        ones.
+
+    Raises
+    ------
+    ``KeyError``
+        There is no style with this name.
+    """
+    global _sequences, _sequences_version
+
+    if style:
+        ansi = style.get(name)
+        if ansi is not None:
+            return _get_sequences(ansi)
+
+    if _sequences_version != _version:
+        _sequences = {}
+        _sequences_version = _version
+
+    try:
+        return _sequences[name]
+    except KeyError:
+        pair = _sequences[name] = _get_sequences(_globals[name])
+        return pair
+
 
 def remove_style(name: str) -> None:
     """
@@ -36,6 +142,7 @@ def remove_style(name: str) -> None:
         The name of the style object.
     """
     del _globals[name]
+    _changed()
 
 
 def remove_all() -> None:
@@ -43,6 +150,7 @@ def remove_all() -> None:
     Removes all styles.
     """
     _globals.clear()
+    _changed()
 
 
 def export(**styles: Ansi) -> None:
@@ -68,10 +176,16 @@ def export(**styles: Ansi) -> None:
     styles
         Ansi objects and an associated name.
     """
-    for name, ansi in styles.items():
-        if not isinstance(ansi, Ansi):
-            raise TypeError(f"{name!r} ({ansi!r}) is not an " f"instance of {Ansi!r}")
-        _globals[name] = ansi
+    try:
+        for name, ansi in styles.items():
+            if not isinstance(ansi, Ansi):
+                raise TypeError(
+                    f"{name!r} ({ansi!r}) is not an " f"instance of {Ansi!r}"
+                )
+            _globals[name] = ansi
+
+    finally:
+        _changed()
 
 
 @cache
@@ -10,6 +10,7 @@ __all__ = ["Terminal"]
 from enum import auto, IntEnum
 import os
 import sys
+import threading
 from typing import Iterable, Optional, TextIO
 
 
@@ -18,6 +19,20 @@ cache: Optional[Terminal] = None
 Cache for supported terminal color system.
 """
 
+override: Optional[Terminal] = None
+"""
+.. versionadded:: 0.2.0
+
+Color system used for every stream by
+:meth:`Terminal.for_stream` if it is not ``None``.
+Set by :func:`adorable.use`.
+"""
+
+_streams: dict[int, Terminal] = {}
+"""Color systems by file descriptor."""
+
+_streams_lock = threading.Lock()
+
 
 class Terminal(IntEnum):
     """
@@ -113,6 +128,79 @@ class Terminal(IntEnum):
         if any(not (st and st.isatty()) for st in stream):
             raise RuntimeError("standard output is not a valid terminal")
 
+        res = cls._from_environment()
+
+        if remember:
+            cache = res
+        return res
+
+    @classmethod
+    def for_stream(cls, stream: TextIO) -> Terminal:
+        """
+        .. versionadded:: 0.2.0
+
+        Returns the color system supported by the
+        terminal a stream is connected to.
+
+        Unlike :meth:`get_term` this never raises an
+        error. Streams that are not a terminal (e.g.
+        a pipe or a file) get :attr:`NOCOLOR`, while
+        terminals are checked like in :meth:`get_term`.
+
+        The result is cached per file descriptor, so
+        each stream is only checked once. This is safe
+        to call from multiple threads.
+
+        Examples
+        --------
+        .. code-block::
+
+           # stdout may be piped while stderr is a terminal
+           Terminal.for_stream(sys.stdout)
+           Terminal.for_stream(sys.stderr)
+
+        Parameters
+        ----------
+        stream
+            The stream to query.
+        """
+        if override is not None:
+            return override
+
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            return cls.NOCOLOR
+
+        res = _streams.get(fd)
+        if res is None:
+            with _streams_lock:
+                res = _streams.get(fd)
+                if res is None:
+                    if os.isatty(fd):
+                        res = cls._from_environment()
+                    else:
+                        res = cls.NOCOLOR
+                    _streams[fd] = res
+
+        return res
+
+    @staticmethod
+    def clear_streams() -> None:
+        """
+        .. versionadded:: 0.2.0
+
+        Clears the cache of :meth:`for_stream`.
+        """
+        with _streams_lock:
+            _streams.clear()
+
+    @classmethod
+    def _from_environment(cls) -> Terminal:
+        """
+        Returns the color system set by environment
+        variables.
+        """
         ac = os.getenv("ADORABLE_COLOR")
         if ac == "nocolor":
             res = cls.NOCOLOR
@@ -140,15 +228,24 @@ class Terminal(IntEnum):
         else:
             res = cls.NOCOLOR
 
-        if remember:
-            cache = res
         return res
 
-    def is_supported(self) -> bool:
+    def is_supported(self, stream: Optional[TextIO] = None) -> bool:
         """
         .. versionadded:: 0.1.1
 
         Checks if the color system is supported
         by the terminal.
+
+        Parameters
+        ----------
+        stream
+            .. versionadded:: 0.2.0
+
+            Check the terminal of this stream instead
+            (see :meth:`for_stream`).
         """
+        if stream is not None:
+            return self.__class__.for_stream(stream) >= self
+
         return self.__class__.get_term() >= self
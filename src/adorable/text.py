@@ -0,0 +1,593 @@
+"""
+.. versionadded:: 0.2.0
+
+Styled text that is stored as plain text and a list
+of styled spans.
+
+A :class:`Text` never contains escape sequences.
+Concatenating, slicing, padding and truncating it
+only moves span boundaries, so the text can be
+measured and cut without parsing escape sequences.
+The escape sequences are created by :meth:`Text.render`
+when the text is written.
+"""
+
+from __future__ import annotations
+
+__all__ = ["Text", "SpanIndex"]
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+from .ansi import Ansi
+from .encoder import Encoder, SGRState, _DEFAULT
+from .measure import _char_width, visible_width
+from .term import Terminal
+
+
+_INDEX_THRESHOLD = 64
+"""Number of spans from which slicing a text uses a :class:`SpanIndex`."""
+
+
+def _copy(style: Ansi) -> Ansi:
+    """
+    Returns a copy of a style for the style table of a
+    text. Each text owns its styles, so changing the
+    style afterwards does not change the text.
+    """
+    return style._replace(style._ansi, style._off)
+
+
+def _add_styles(
+    styles: list[Ansi], table: dict[tuple[Any, ...], int], new: Iterable[Ansi]
+) -> list[int]:
+    """
+    Adds styles to the style table of a text and
+    returns their indices. Styles with the same
+    parameters share an index.
+    """
+    indices = []
+    for style in new:
+        index = table.get(style._ansi)
+        if index is None:
+            index = table[style._ansi] = len(styles)
+            styles.append(style)
+        indices.append(index)
+    return indices
+
+
+def _table(styles: Sequence[Ansi]) -> dict[tuple[Any, ...], int]:
+    """
+    Returns the index of the parameters of each style.
+    """
+    return {style._ansi: index for index, style in enumerate(styles)}
+
+
+@lru_cache(maxsize=1024)
+def _state(params: tuple[tuple[Any, ...], ...]) -> SGRState:
+    """
+    Returns the state of overlapping spans. Later
+    spans are applied on top of earlier ones.
+    """
+    state = _DEFAULT
+    for value in params:
+        state = state.apply(value)
+    return state
+
+
+class SpanIndex:
+    """
+    Interval index that finds the spans overlapping a
+    range of a text.
+
+    The spans are sorted by their start, so the spans
+    that start within the range are found by bisection.
+    The spans that start before the range and reach into
+    it are found in a tree that stores the largest end
+    of every group of spans. A query costs
+    ``O(log n + k log n)`` for ``k`` overlapping spans
+    instead of ``O(n)``.
+
+    Parameters
+    ----------
+    starts
+        Start of every span.
+
+    ends
+        End of every span.
+    """
+
+    __slots__ = ("_order", "_starts", "_ends", "_size", "_tree")
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int]) -> None:
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        self._order = array("l", order)
+        self._starts = array("l", [starts[index] for index in order])
+        self._ends = array("l", [ends[index] for index in order])
+
+        size = 1
+        while size < len(order):
+            size *= 2
+        self._size = size
+
+        # largest end of the spans below each node, leaves start at ``size``
+        tree = array("l", [-1]) * (2 * size)
+        tree[size:size + len(order)] = self._ends
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def overlapping(self, start: int, stop: int) -> list[int]:
+        """
+        Returns the indices of the spans that overlap
+        ``[start, stop)`` in ascending order.
+
+        Parameters
+        ----------
+        start
+            Start of the range.
+
+        stop
+            End of the range.
+        """
+        if start >= stop:
+            return []
+
+        starts = self._starts
+        ends = self._ends
+        order = self._order
+        first = bisect_left(starts, start)
+        last = bisect_left(starts, stop)
+
+        found = [order[i] for i in range(first, last) if ends[i] > start]
+
+        # spans that start before the range and end within or after it
+        tree = self._tree
+        size = self._size
+        stack = [(1, 0, size)]
+        while stack:
+            node, low, high = stack.pop()
+            if low >= first or tree[node] <= start:
+                continue
+            if node >= size:
+                found.append(order[low])
+                continue
+            middle = (low + high) // 2
+            stack.append((2 * node, low, middle))
+            stack.append((2 * node + 1, middle, high))
+
+        found.sort()
+        return found
+
+
+class Text:
+    """
+    Immutable styled text.
+
+    The text consists of the plain string and spans
+    ``(start, end, style)`` which are stored in arrays.
+    Each text has its own table of styles that the
+    spans refer to. Overlapping spans are combined;
+    the span added last is applied on top of the
+    others.
+
+    Slicing a text with many spans uses a
+    :class:`SpanIndex`, so the cost of rendering a part
+    of a large text depends on the size of the part.
+
+    Examples
+    --------
+    .. code-block::
+
+       from adorable import BOLD, Text
+
+       text = Text("error: ", BOLD) + "file not found"
+       print(text.truncate(12, "…").render())
+
+    Parameters
+    ----------
+    plain
+        The plain text.
+
+    style
+        Ansi object that styles the whole text.
+    """
+
+    __slots__ = ("_plain", "_starts", "_ends", "_ids", "_styles", "_index")
+
+    def __init__(self, plain: str = "", style: Optional[Ansi] = None) -> None:
+        self._plain = plain
+        self._starts = array("l")
+        self._ends = array("l")
+        self._ids = array("L")
+        self._styles: tuple[Ansi, ...] = ()
+        self._index: Optional[SpanIndex] = None
+
+        if style is not None and plain:
+            self._starts.append(0)
+            self._ends.append(len(plain))
+            self._ids.append(0)
+            self._styles = (_copy(style),)
+
+    @classmethod
+    def _new(
+        cls,
+        plain: str,
+        starts: array[int],
+        ends: array[int],
+        ids: array[int],
+        styles: tuple[Ansi, ...],
+    ) -> Text:
+        text = cls.__new__(cls)
+        text._plain = plain
+        text._starts = starts
+        text._ends = ends
+        text._ids = ids
+        text._styles = styles
+        text._index = None
+        return text
+
+    @classmethod
+    def from_ansi(cls, text: str) -> Text:
+        """
+        Returns styled text with escape sequences as
+        :class:`Text`. See
+        :class:`adorable.decoder.AnsiDecoder`.
+
+        Parameters
+        ----------
+        text
+            The styled text.
+        """
+        from .decoder import AnsiDecoder
+
+        return AnsiDecoder(Terminal.BIT24).decode(text)
+
+    @property
+    def plain(self) -> str:
+        """
+        The text without styles.
+        """
+        return self._plain
+
+    @property
+    def spans(self) -> list[tuple[int, int, Ansi]]:
+        """
+        The spans as ``(start, end, style)``. The styles
+        are copies of the styles the spans were created
+        with.
+        """
+        styles = self._styles
+        return [
+            (start, end, styles[id_])
+            for start, end, id_ in zip(self._starts, self._ends, self._ids)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._plain)
+
+    def __bool__(self) -> bool:
+        return bool(self._plain)
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return f"<Text {self._plain!r} ({len(self._ids)} spans)>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Text):
+            return NotImplemented
+        return (
+            self._plain == other._plain
+            and self._starts == other._starts
+            and self._ends == other._ends
+            and self._params() == other._params()
+        )
+
+    def __hash__(self) -> int:
+        return hash(
+            (
+                self._plain,
+                bytes(self._starts),
+                bytes(self._ends),
+                self._params(),
+            )
+        )
+
+    def _params(self) -> tuple[tuple[Any, ...], ...]:
+        """
+        Returns the SGR parameters of every span.
+        """
+        styles = self._styles
+        return tuple(styles[id_]._ansi for id_ in self._ids)
+
+    def __add__(self, other: Union[Text, str]) -> Text:
+        if isinstance(other, str):
+            other = Text(other)
+        elif not isinstance(other, Text):
+            return NotImplemented
+
+        plain = self._plain + other._plain
+        if not other._ids:
+            return self._new(
+                plain, self._starts, self._ends, self._ids, self._styles
+            )
+
+        offset = len(self._plain)
+        starts = self._starts + array(
+            "l", [start + offset for start in other._starts]
+        )
+        ends = self._ends + array("l", [end + offset for end in other._ends])
+
+        if not self._ids or other._styles is self._styles:
+            styles = other._styles
+            ids = self._ids + other._ids
+        else:
+            merged = list(self._styles)
+            indices = _add_styles(merged, _table(merged), other._styles)
+            styles = tuple(merged)
+            ids = self._ids + array("L", [indices[id_] for id_ in other._ids])
+
+        return self._new(plain, starts, ends, ids, styles)
+
+    def __radd__(self, other: str) -> Text:
+        if not isinstance(other, str):
+            return NotImplemented
+        return Text(other) + self
+
+    def __getitem__(self, key: Union[int, slice]) -> Text:
+        if isinstance(key, int):
+            if key < 0:
+                key += len(self._plain)
+            if not 0 <= key < len(self._plain):
+                raise IndexError("text index out of range")
+            return self._slice(key, key + 1)
+
+        start, stop, step = key.indices(len(self._plain))
+        if step != 1:
+            raise ValueError("text slices do not support steps")
+        return self._slice(start, max(start, stop))
+
+    def _slice(self, start: int, stop: int) -> Text:
+        """
+        Returns the text between ``start`` and ``stop``.
+        Spans are clipped and empty spans are removed.
+        """
+        starts = array("l")
+        ends = array("l")
+        ids = array("L")
+
+        if len(self._ids) < _INDEX_THRESHOLD:
+            spans: Iterable[int] = range(len(self._ids))
+        else:
+            if self._index is None:
+                self._index = SpanIndex(self._starts, self._ends)
+            spans = self._index.overlapping(start, stop)
+
+        for span in spans:
+            span_start = self._starts[span]
+            span_end = self._ends[span]
+            if span_start < stop and span_end > start:
+                starts.append(max(span_start, start) - start)
+                ends.append(min(span_end, stop) - start)
+                ids.append(self._ids[span])
+
+        return self._new(
+            self._plain[start:stop], starts, ends, ids, self._styles
+        )
+
+    def stylize(
+        self, style: Ansi, start: int = 0, end: Optional[int] = None
+    ) -> Text:
+        """
+        Returns a copy with a style added on top of a
+        part of the text.
+
+        Parameters
+        ----------
+        style
+            Ansi object that styles the part.
+
+        start
+            Index of the first character.
+
+        end
+            Index after the last character. Defaults to
+            the end of the text.
+        """
+        start, end, _ = slice(start, end).indices(len(self._plain))
+        if start >= end:
+            return self
+
+        styles = list(self._styles)
+        (index,) = _add_styles(styles, _table(styles), [_copy(style)])
+
+        starts = array("l", self._starts)
+        ends = array("l", self._ends)
+        ids = array("L", self._ids)
+        starts.append(start)
+        ends.append(end)
+        ids.append(index)
+        return self._new(self._plain, starts, ends, ids, tuple(styles))
+
+    def pad(self, width: int, align: str = "left", fill: str = " ") -> Text:
+        """
+        Returns the text padded to ``width`` terminal
+        cells with unstyled characters. Text that is
+        already wide enough is returned as is.
+
+        Parameters
+        ----------
+        width
+            The number of cells.
+
+        align
+            ``"left"``, ``"center"`` or ``"right"``.
+
+        fill
+            The character to pad with. It must take a
+            single cell.
+        """
+        if visible_width(fill) != 1:
+            raise ValueError("fill must be a single cell wide")
+
+        missing = width - visible_width(self._plain)
+        if missing <= 0:
+            return self
+
+        if align == "left":
+            left = 0
+        elif align == "center":
+            left = missing // 2
+        elif align == "right":
+            left = missing
+        else:
+            raise ValueError(f"invalid alignment {align!r}")
+
+        return fill * left + self + fill * (missing - left)
+
+    def truncate(self, width: int, ellipsis: str = "") -> Text:
+        """
+        Returns the text cut to at most ``width``
+        terminal cells. Text that fits is returned as is.
+
+        Parameters
+        ----------
+        width
+            The number of cells.
+
+        ellipsis
+            Unstyled string that replaces the removed
+            part, e.g. ``"…"``. It counts towards the
+            width.
+        """
+        if visible_width(self._plain) <= width:
+            return self
+
+        available = width - visible_width(ellipsis)
+        if available < 0:
+            return Text()
+
+        used = 0
+        stop = 0
+        for char in self._plain:
+            used += _char_width(char)
+            if used > available:
+                break
+            stop += 1
+
+        return self._slice(0, stop) + ellipsis
+
+    def join(self, texts: Iterable[Union[Text, str]]) -> Text:
+        """
+        Concatenates texts with this text between them,
+        like :pymeth:`str.join`.
+
+        Parameters
+        ----------
+        texts
+            Texts or strings to join.
+        """
+        plain: list[str] = []
+        starts = array("l")
+        ends = array("l")
+        ids = array("L")
+        styles: list[Ansi] = []
+        table: dict[tuple[Any, ...], int] = {}
+        offset = 0
+
+        for index, text in enumerate(texts):
+            if isinstance(text, str):
+                text = Text(text)
+
+            for part in (self, text) if index else (text,):
+                if part._ids:
+                    indices = _add_styles(styles, table, part._styles)
+                    starts.extend(start + offset for start in part._starts)
+                    ends.extend(end + offset for end in part._ends)
+                    ids.extend(indices[id_] for id_ in part._ids)
+                plain.append(part._plain)
+                offset += len(part._plain)
+
+        return self._new("".join(plain), starts, ends, ids, tuple(styles))
+
+    def segments(self) -> Iterator[tuple[str, SGRState]]:
+        """
+        Yields the parts of the text that have the same
+        style and the style of each part.
+        """
+        if not self._ids:
+            if self._plain:
+                yield self._plain, _DEFAULT
+            return
+
+        events: list[tuple[int, int]] = []
+        for index, (start, end) in enumerate(zip(self._starts, self._ends)):
+            if start < end:
+                events.append((start, index))
+                events.append((end, ~index))
+        events.sort()
+
+        styles = self._styles
+        active: set[int] = set()
+        position = 0
+
+        for boundary, index in events:
+            if boundary > position:
+                params = tuple(
+                    styles[self._ids[i]]._ansi for i in sorted(active)
+                )
+                yield self._plain[position:boundary], _state(params)
+                position = boundary
+
+            if index >= 0:
+                active.add(index)
+            else:
+                active.discard(~index)
+
+        if position < len(self._plain):
+            yield self._plain[position:], _DEFAULT
+
+    def render(
+        self,
+        terminal: Optional[Terminal] = None,
+        encoder: Optional[Encoder] = None,
+    ) -> str:
+        """
+        Returns the text with escape sequences.
+
+        Parameters
+        ----------
+        terminal
+            The color system to render the colors for.
+            Colors that it does not support are replaced
+            with the closest supported color. By default
+            colors are rendered as they are.
+
+        encoder
+            Encoder to write the text with. The style is
+            not disabled at the end, like with
+            :func:`adorable.paint`. By default the style
+            is disabled at the end.
+        """
+        close = encoder is None
+        if encoder is None:
+            encoder = Encoder()
+
+        parts = []
+        for part, state in self.segments():
+            if terminal is not None:
+                state = state.downgrade(terminal)
+            parts.append(encoder.write(part, state))
+
+        if close:
+            parts.append(encoder.close())
+
+        return "".join(parts)
@@ -1,153 +1,269 @@
 """
-This module contains a dictionary of all web
-color names and their rgb values.
+This module contains all web color names and their
+rgb values.
+
+.. versionchanged:: 0.2.0
+    The names are stored sorted and the rgb values
+    packed into bytes. :data:`COLORS` is a read-only
+    mapping. The closest 8bit and 3bit color of each
+    web color is precomputed.
 """
 
-COLORS = dict(
-    aliceblue=(240, 248, 255),
-    antiquewhite=(250, 235, 215),
-    aqua=(0, 255, 255),
-    aquamarine=(127, 255, 212),
-    azure=(240, 255, 255),
-    beige=(245, 245, 220),
-    bisque=(255, 228, 196),
-    blanchedalmond=(255, 235, 205),
-    blue=(0, 0, 255),
-    blueviolet=(138, 43, 226),
-    brown=(165, 42, 42),
-    burlywood=(222, 184, 135),
-    cadetblue=(95, 158, 160),
-    chartreuse=(127, 255, 0),
-    chocolate=(210, 105, 30),
-    coral=(255, 127, 80),
-    cornflowerblue=(100, 149, 237),
-    cornsilk=(255, 248, 220),
-    crimson=(220, 20, 60),
-    cyan=(0, 255, 255),
-    darkblue=(0, 0, 139),
-    darkcyan=(0, 139, 139),
-    darkgoldenrod=(184, 134, 11),
-    darkgray=(169, 169, 169),
-    darkgreen=(0, 100, 0),
-    darkgrey=(169, 169, 169),
-    darkkhaki=(189, 183, 107),
-    darkmagenta=(139, 0, 139),
-    darkolivegreen=(85, 107, 47),
-    darkorange=(255, 140, 0),
-    darkorchid=(153, 50, 204),
-    darkred=(139, 0, 0),
-    darksalmon=(233, 150, 122),
-    darkseagreen=(143, 188, 143),
-    darkslateblue=(72, 61, 139),
-    darkslategray=(47, 79, 79),
-    darkslategrey=(47, 79, 79),
-    darkturquoise=(0, 206, 209),
-    darkviolet=(148, 0, 211),
-    deeppink=(255, 20, 147),
-    deepskyblue=(0, 191, 255),
-    dimgray=(105, 105, 105),
-    dimgrey=(105, 105, 105),
-    dodgerblue=(30, 144, 255),
-    firebrick=(178, 34, 34),
-    floralwhite=(255, 250, 240),
-    forestgreen=(34, 139, 34),
-    fuchsia=(255, 0, 255),
-    gainsboro=(220, 220, 220),
-    ghostwhite=(248, 248, 255),
-    gold=(255, 215, 0),
-    goldenrod=(218, 165, 32),
-    gray=(128, 128, 128),
-    green=(0, 128, 0),
-    greenyellow=(173, 255, 47),
-    grey=(128, 128, 128),
-    honeydew=(240, 255, 240),
-    hotpink=(255, 105, 180),
-    indianred=(205, 92, 92),
-    indigo=(75, 0, 130),
-    ivory=(255, 255, 240),
-    khaki=(240, 230, 140),
-    lavender=(230, 230, 250),
-    lavenderblush=(255, 240, 245),
-    lawngreen=(124, 252, 0),
-    lemonchiffon=(255, 250, 205),
-    lightblue=(173, 216, 230),
-    lightcoral=(240, 128, 128),
-    lightcyan=(224, 255, 255),
-    lightgoldenrodyellow=(250, 250, 210),
-    lightgray=(211, 211, 211),
-    lightgreen=(144, 238, 144),
-    lightgrey=(211, 211, 211),
-    lightpink=(255, 182, 193),
-    lightsalmon=(255, 160, 122),
-    lightseagreen=(32, 178, 170),
-    lightskyblue=(135, 206, 250),
-    lightslategray=(119, 136, 153),
-    lightslategrey=(119, 136, 153),
-    lightsteelblue=(176, 196, 222),
-    lightyellow=(255, 255, 224),
-    lime=(0, 255, 0),
-    limegreen=(50, 205, 50),
-    linen=(250, 240, 230),
-    magenta=(255, 0, 255),
-    maroon=(128, 0, 0),
-    mediumaquamarine=(102, 205, 170),
-    mediumblue=(0, 0, 205),
-    mediumorchid=(186, 85, 211),
-    mediumpurple=(147, 112, 219),
-    mediumseagreen=(60, 179, 113),
-    mediumslateblue=(123, 104, 238),
-    mediumspringgreen=(0, 250, 154),
-    mediumturquoise=(72, 209, 204),
-    mediumvioletred=(199, 21, 133),
-    midnightblue=(25, 25, 112),
-    mintcream=(245, 255, 250),
-    mistyrose=(255, 228, 225),
-    moccasin=(255, 228, 181),
-    navajowhite=(255, 222, 173),
-    navy=(0, 0, 128),
-    oldlace=(253, 245, 230),
-    olive=(128, 128, 0),
-    olivedrab=(107, 142, 35),
-    orange=(255, 165, 0),
-    orangered=(255, 69, 0),
-    orchid=(218, 112, 214),
-    palegoldenrod=(238, 232, 170),
-    palegreen=(152, 251, 152),
-    paleturquoise=(175, 238, 238),
-    palevioletred=(219, 112, 147),
-    papayawhip=(255, 239, 213),
-    peachpuff=(255, 218, 185),
-    peru=(205, 133, 63),
-    pink=(255, 192, 203),
-    plum=(221, 160, 221),
-    powderblue=(176, 224, 230),
-    purple=(128, 0, 128),
-    red=(255, 0, 0),
-    rosybrown=(188, 143, 143),
-    royalblue=(65, 105, 225),
-    saddlebrown=(139, 69, 19),
-    salmon=(250, 128, 114),
-    sandybrown=(244, 164, 96),
-    seagreen=(46, 139, 87),
-    seashell=(255, 245, 238),
-    sienna=(160, 82, 45),
-    silver=(192, 192, 192),
-    skyblue=(135, 206, 235),
-    slateblue=(106, 90, 205),
-    slategray=(112, 128, 144),
-    slategrey=(112, 128, 144),
-    snow=(255, 250, 250),
-    springgreen=(0, 255, 127),
-    steelblue=(70, 130, 180),
-    tan=(210, 180, 140),
-    teal=(0, 128, 128),
-    thistle=(216, 191, 216),
-    tomato=(255, 99, 71),
-    turquoise=(64, 224, 208),
-    violet=(238, 130, 238),
-    wheat=(245, 222, 179),
-    white=(255, 255, 255),
-    whitesmoke=(245, 245, 245),
-    yellow=(255, 255, 0),
-    yellowgreen=(154, 205, 50),
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping
+
+
+NAMES: tuple[str, ...] = (
+    "aliceblue",
+    "antiquewhite",
+    "aqua",
+    "aquamarine",
+    "azure",
+    "beige",
+    "bisque",
+    "blanchedalmond",
+    "blue",
+    "blueviolet",
+    "brown",
+    "burlywood",
+    "cadetblue",
+    "chartreuse",
+    "chocolate",
+    "coral",
+    "cornflowerblue",
+    "cornsilk",
+    "crimson",
+    "cyan",
+    "darkblue",
+    "darkcyan",
+    "darkgoldenrod",
+    "darkgray",
+    "darkgreen",
+    "darkgrey",
+    "darkkhaki",
+    "darkmagenta",
+    "darkolivegreen",
+    "darkorange",
+    "darkorchid",
+    "darkred",
+    "darksalmon",
+    "darkseagreen",
+    "darkslateblue",
+    "darkslategray",
+    "darkslategrey",
+    "darkturquoise",
+    "darkviolet",
+    "deeppink",
+    "deepskyblue",
+    "dimgray",
+    "dimgrey",
+    "dodgerblue",
+    "firebrick",
+    "floralwhite",
+    "forestgreen",
+    "fuchsia",
+    "gainsboro",
+    "ghostwhite",
+    "gold",
+    "goldenrod",
+    "gray",
+    "green",
+    "greenyellow",
+    "grey",
+    "honeydew",
+    "hotpink",
+    "indianred",
+    "indigo",
+    "ivory",
+    "khaki",
+    "lavender",
+    "lavenderblush",
+    "lawngreen",
+    "lemonchiffon",
+    "lightblue",
+    "lightcoral",
+    "lightcyan",
+    "lightgoldenrodyellow",
+    "lightgray",
+    "lightgreen",
+    "lightgrey",
+    "lightpink",
+    "lightsalmon",
+    "lightseagreen",
+    "lightskyblue",
+    "lightslategray",
+    "lightslategrey",
+    "lightsteelblue",
+    "lightyellow",
+    "lime",
+    "limegreen",
+    "linen",
+    "magenta",
+    "maroon",
+    "mediumaquamarine",
+    "mediumblue",
+    "mediumorchid",
+    "mediumpurple",
+    "mediumseagreen",
+    "mediumslateblue",
+    "mediumspringgreen",
+    "mediumturquoise",
+    "mediumvioletred",
+    "midnightblue",
+    "mintcream",
+    "mistyrose",
+    "moccasin",
+    "navajowhite",
+    "navy",
+    "oldlace",
+    "olive",
+    "olivedrab",
+    "orange",
+    "orangered",
+    "orchid",
+    "palegoldenrod",
+    "palegreen",
+    "paleturquoise",
+    "palevioletred",
+    "papayawhip",
+    "peachpuff",
+    "peru",
+    "pink",
+    "plum",
+    "powderblue",
+    "purple",
+    "red",
+    "rosybrown",
+    "royalblue",
+    "saddlebrown",
+    "salmon",
+    "sandybrown",
+    "seagreen",
+    "seashell",
+    "sienna",
+    "silver",
+    "skyblue",
+    "slateblue",
+    "slategray",
+    "slategrey",
+    "snow",
+    "springgreen",
+    "steelblue",
+    "tan",
+    "teal",
+    "thistle",
+    "tomato",
+    "turquoise",
+    "violet",
+    "wheat",
+    "white",
+    "whitesmoke",
+    "yellow",
+    "yellowgreen",
 )
+"""Sorted names of all web colors."""
+
+_RGB: bytes = bytes.fromhex(
+    "f0f8ff faebd7 00ffff 7fffd4 f0ffff f5f5dc ffe4c4 ffebcd"
+    "0000ff 8a2be2 a52a2a deb887 5f9ea0 7fff00 d2691e ff7f50"
+    "6495ed fff8dc dc143c 00ffff 00008b 008b8b b8860b a9a9a9"
+    "006400 a9a9a9 bdb76b 8b008b 556b2f ff8c00 9932cc 8b0000"
+    "e9967a 8fbc8f 483d8b 2f4f4f 2f4f4f 00ced1 9400d3 ff1493"
+    "00bfff 696969 696969 1e90ff b22222 fffaf0 228b22 ff00ff"
+    "dcdcdc f8f8ff ffd700 daa520 808080 008000 adff2f 808080"
+    "f0fff0 ff69b4 cd5c5c 4b0082 fffff0 f0e68c e6e6fa fff0f5"
+    "7cfc00 fffacd add8e6 f08080 e0ffff fafad2 d3d3d3 90ee90"
+    "d3d3d3 ffb6c1 ffa07a 20b2aa 87cefa 778899 778899 b0c4de"
+    "ffffe0 00ff00 32cd32 faf0e6 ff00ff 800000 66cdaa 0000cd"
+    "ba55d3 9370db 3cb371 7b68ee 00fa9a 48d1cc c71585 191970"
+    "f5fffa ffe4e1 ffe4b5 ffdead 000080 fdf5e6 808000 6b8e23"
+    "ffa500 ff4500 da70d6 eee8aa 98fb98 afeeee db7093 ffefd5"
+    "ffdab9 cd853f ffc0cb dda0dd b0e0e6 800080 ff0000 bc8f8f"
+    "4169e1 8b4513 fa8072 f4a460 2e8b57 fff5ee a0522d c0c0c0"
+    "87ceeb 6a5acd 708090 708090 fffafa 00ff7f 4682b4 d2b48c"
+    "008080 d8bfd8 ff6347 40e0d0 ee82ee f5deb3 ffffff f5f5f5"
+    "ffff00 9acd32"
+)
+"""Packed rgb values in the order of :data:`NAMES`."""
+
+INDEX8: bytes = bytes.fromhex(
+    "0f e0 0e 7a 0f e6 e0 e0 0c 5c 7c b4 49 76 a6 d1"
+    "45 e6 a1 0e 12 1e 88 f8 16 f8 8f 5a ef d0 62 58"
+    "ae 6c 3c ee ee 2c 5c c6 27 f2 f2 21 7c 0f 1c 0d"
+    "fd 0f dc b2 08 02 9a 08 ff cd a7 36 0f de ff 0f"
+    "76 e6 98 d2 c3 e6 fc 78 fc d9 d8 25 75 66 66 98"
+    "e6 0a 4d ff 0d 01 4f 14 86 62 47 63 30 50 a2 04"
+    "0f e0 df df 04 e6 03 40 d6 ca aa df 78 9f a8 e6"
+    "df ad da b6 98 05 09 8a 3e 5e d1 d7 1d ff 82 07"
+    "74 3e 42 42 0f 30 43 b4 06 b6 cb 50 d5 df 0f ff"
+    "0b 71"
+)
+"""Index of the closest 8bit color in the order of :data:`NAMES`."""
+
+INDEX3: bytes = bytes.fromhex(
+    "07 07 06 04 07 07 07 07 05 05 01 03 04 03 03 03"
+    "04 07 05 06 00 06 03 04 02 04 03 05 02 03 05 01"
+    "03 04 05 02 02 06 05 05 06 02 02 06 01 07 02 05"
+    "07 07 03 03 04 02 03 04 07 05 05 05 07 07 07 07"
+    "03 07 07 03 07 07 07 04 07 07 03 06 04 04 04 07"
+    "07 02 02 07 05 01 06 05 05 04 02 04 06 06 05 00"
+    "07 07 07 07 00 07 02 02 03 03 04 07 07 07 05 07"
+    "07 03 07 07 07 05 01 04 04 01 03 03 02 07 01 07"
+    "04 04 04 04 07 06 04 03 06 07 03 06 07 07 07 07"
+    "03 03"
+)
+"""Index of the closest 3bit color in the order of :data:`NAMES`."""
+
+
+def index(name: str) -> int:
+    """
+    Returns the position of a web color in :data:`NAMES`.
+
+    Parameters
+    ----------
+    name
+        The lowercase name of the web color.
+
+    Raises
+    ------
+    ``KeyError``
+        There is no web color with this name.
+    """
+    i = bisect_left(NAMES, name)
+    if i == len(NAMES) or NAMES[i] != name:
+        raise KeyError(name)
+
+    return i
+
+
+def rgb(index: int) -> tuple[int, int, int]:
+    """
+    Returns the rgb value of the web color at a
+    position of :data:`NAMES`.
+    """
+    i = index * 3
+    return _RGB[i], _RGB[i + 1], _RGB[i + 2]
+
+
+class _Colors(Mapping[str, tuple[int, int, int]]):
+    """
+    Read-only mapping of web color names onto their
+    rgb values.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, name: str) -> tuple[int, int, int]:
+        return rgb(index(name))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(NAMES)
+
+    def __len__(self) -> int:
+        return len(NAMES)
+
+
+COLORS: Mapping[str, tuple[int, int, int]] = _Colors()
+"""All web color names and their rgb values."""
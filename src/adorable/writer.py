@@ -0,0 +1,709 @@
+"""
+.. versionadded:: 0.2.0
+
+Buffered output of styled text.
+"""
+
+from __future__ import annotations
+
+__all__ = ["StyledWriter", "BackgroundWriter", "DowngradingStream"]
+
+import errno
+from functools import lru_cache
+import io
+from queue import Empty, SimpleQueue
+import re
+import sys
+import threading
+from time import monotonic
+from types import TracebackType
+from typing import Any, BinaryIO, Optional, TextIO, Union
+
+from .ansi import Ansi, paint
+from .term import Terminal
+
+
+def _write_all(stream: Any, data: Union[bytes, memoryview]) -> None:
+    """
+    Writes bytes to a stream. Raw streams may only
+    write a part at once. Raises ``OSError`` if the
+    stream does not accept any bytes and
+    ``BlockingIOError`` if a non-blocking raw stream
+    would block.
+    """
+    total = 0
+    while data:
+        written = stream.write(data)
+        if written is None:
+            if isinstance(stream, io.RawIOBase):
+                raise BlockingIOError(
+                    errno.EAGAIN, "write would block", total
+                )
+            break
+        if written >= len(data):
+            break
+        if written == 0:
+            raise OSError("stream did not accept any bytes")
+        total += written
+        data = data[written:]
+
+
+class StyledWriter:
+    """
+    Collects styled text and writes it to a stream in
+    large chunks instead of one write per call.
+
+    The output is identical to writing each piece of
+    text directly. The buffer is written when it is
+    full, when ``flush_interval`` seconds passed since
+    the last write to the stream, on :meth:`flush` and
+    when the writer is closed.
+
+    A writer can also be used as ``file`` of
+    :pyfn:`print` and :func:`adorable.printc`.
+
+    Examples
+    --------
+    .. code-block::
+
+       with StyledWriter(sys.stdout) as out:
+           for line in lines:
+               out.printc(line, style=GREEN)
+
+    Parameters
+    ----------
+    stream
+        A text or binary stream. Defaults to standard
+        output.
+
+    buffer_size
+        Number of characters (text streams) or bytes
+        (binary streams) to collect before writing.
+
+    flush_interval
+        Maximum number of seconds text stays in the
+        buffer. This is only checked when new text is
+        written. ``None`` disables it.
+
+    encoding
+        Encoding used for binary streams.
+
+    binary
+        Whether ``stream`` is a binary stream. Detected
+        automatically by default.
+    """
+
+    def __init__(
+        self,
+        stream: Union[TextIO, BinaryIO, None] = None,
+        buffer_size: int = 8192,
+        flush_interval: Optional[float] = None,
+        encoding: str = "utf-8",
+        binary: Optional[bool] = None,
+    ) -> None:
+        if buffer_size < 1:
+            raise ValueError("buffer size must be positive")
+
+        self.stream: Any = stream or sys.stdout
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.encoding = encoding
+
+        if binary is None:
+            binary = isinstance(self.stream, (io.RawIOBase, io.BufferedIOBase))
+        self.binary = binary
+
+        self._chunks: list[str] = []
+        self._bytes = bytearray(buffer_size if binary else 0)
+        self._size = 0
+        self._last_flush = monotonic()
+        self.closed = False
+
+    def __enter__(self) -> StyledWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def write(self, text: str, style: Optional[Ansi] = None) -> int:
+        """
+        Writes a styled string into the buffer.
+
+        Parameters
+        ----------
+        text
+            The text to write.
+
+        style
+            Ansi object that styles the text.
+
+        Returns
+        -------
+        Number of characters written.
+        """
+        if self.closed:
+            raise ValueError("write to closed writer")
+
+        if style is not None:
+            text = paint(text, style=style)
+
+        if self.binary:
+            self._write_bytes(text.encode(self.encoding))
+
+        else:
+            self._chunks.append(text)
+            self._size += len(text)
+            if self._size >= self.buffer_size:
+                self.flush()
+
+        if (
+            self.flush_interval is not None
+            and monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+        return len(text)
+
+    def _write_bytes(self, data: bytes) -> None:
+        """
+        Copies bytes into the preallocated buffer.
+        """
+        size = len(data)
+        if self._size + size > self.buffer_size:
+            self.flush()
+
+        if size >= self.buffer_size:
+            # too large for the buffer anyway
+            self._write_all(data)
+            self._last_flush = monotonic()
+            return
+
+        self._bytes[self._size:self._size + size] = data
+        self._size += size
+
+    def _write_all(self, data: Union[bytes, memoryview]) -> None:
+        """
+        Writes bytes to the stream.
+        """
+        _write_all(self.stream, data)
+
+    def printc(
+        self,
+        *args: Any,
+        style: Optional[Ansi] = None,
+        sep: str = " ",
+        end: str = "\n",
+        flush: bool = False,
+    ) -> None:
+        """
+        Writes a styled string like :func:`adorable.printc`
+        does.
+
+        Parameters
+        ----------
+        args
+            Objects to style.
+
+        style
+            Ansi object that styles the string.
+
+        sep
+            String that separates ``args``.
+
+        end
+            String appended after the styled string.
+
+        flush
+            Whether to flush the buffer afterwards.
+        """
+        self.write(paint(*args, style=style, sep=sep) + end)
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffer to the stream and flushes
+        the stream.
+        """
+        if self._size:
+            if self.binary:
+                with memoryview(self._bytes) as view:
+                    self._write_all(view[: self._size])
+            else:
+                self.stream.write("".join(self._chunks))
+                self._chunks.clear()
+            self._size = 0
+
+        self._last_flush = monotonic()
+        self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Flushes the buffer. The stream is not closed.
+        """
+        if not self.closed:
+            self.flush()
+            self.closed = True
+
+
+class BackgroundWriter:
+    """
+    Writes styled records of many threads through a
+    single writer thread.
+
+    Every record is rendered by the calling thread and
+    put into a queue, so the caller never waits for the
+    stream. The writer thread takes all queued records
+    at once and writes them with a single call. Records
+    are never split, so escape sequences of different
+    threads cannot interleave.
+
+    .. caution::
+
+       Records that are still queued when the program
+       exits are lost. Call :meth:`close` or use the
+       writer as a context manager.
+
+    Examples
+    --------
+    .. code-block::
+
+       with BackgroundWriter(sys.stdout) as out:
+           # in any thread
+           out.printc("done", style=GREEN)
+
+    Parameters
+    ----------
+    stream
+        A text or binary stream. Defaults to standard
+        output.
+
+    batch_size
+        Maximum number of records written at once.
+
+    encoding
+        Encoding used for binary streams.
+    """
+
+    def __init__(
+        self,
+        stream: Union[TextIO, BinaryIO, None] = None,
+        batch_size: int = 1024,
+        encoding: str = "utf-8",
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch size must be positive")
+
+        self.batch_size = batch_size
+        self.closed = False
+
+        self._writer = StyledWriter(
+            stream, buffer_size=1 << 16, encoding=encoding
+        )
+        self._queue: SimpleQueue[Union[str, threading.Event, None]] = (
+            SimpleQueue()
+        )
+        # nothing is queued after ``None`` while this is held
+        self._lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name="adorable-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> BackgroundWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def write(self, text: str, style: Optional[Ansi] = None) -> int:
+        """
+        Queues a styled string as a single record.
+
+        Parameters
+        ----------
+        text
+            The text to write.
+
+        style
+            Ansi object that styles the text.
+
+        Returns
+        -------
+        Number of characters queued.
+        """
+        if style is not None:
+            text = paint(text, style=style)
+
+        with self._lock:
+            if self.closed:
+                raise ValueError("write to closed writer")
+            self._queue.put(text)
+
+        return len(text)
+
+    def printc(
+        self,
+        *args: Any,
+        style: Optional[Ansi] = None,
+        sep: str = " ",
+        end: str = "\n",
+    ) -> None:
+        """
+        Queues a styled string like :func:`adorable.printc`
+        prints it. The string including ``end`` is a single
+        record.
+
+        Parameters
+        ----------
+        args
+            Objects to style.
+
+        style
+            Ansi object that styles the string.
+
+        sep
+            String that separates ``args``.
+
+        end
+            String appended after the styled string.
+        """
+        self.write(paint(*args, style=style, sep=sep) + end)
+
+    def flush(self) -> None:
+        """
+        Waits until all records queued so far are
+        written.
+
+        Raises
+        ------
+        ``Exception``
+            Writing to the stream failed.
+        """
+        done = threading.Event()
+        with self._lock:
+            if self.closed:
+                done.set()
+            else:
+                self._queue.put(done)
+
+        done.wait()
+        self._raise()
+
+    def close(self) -> None:
+        """
+        Writes all queued records and stops the writer
+        thread. The stream is not closed.
+        """
+        with self._lock:
+            if not self.closed:
+                self.closed = True
+                self._queue.put(None)
+
+        self._thread.join()
+
+        self._raise()
+
+    def _raise(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self) -> None:
+        """
+        Writes queued records until ``None`` is queued.
+        Everything queued before ``None`` is written and
+        waiting threads are woken up.
+        """
+        stop = False
+        while True:
+            item = self._queue.get()
+            records: list[str] = []
+            waiting: list[threading.Event] = []
+
+            while True:
+                if item is None:
+                    stop = True
+
+                elif isinstance(item, threading.Event):
+                    waiting.append(item)
+
+                else:
+                    records.append(item)
+                    if len(records) >= self.batch_size:
+                        break
+
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+
+            if records:
+                try:
+                    self._writer.write("".join(records))
+                    self._writer.flush()
+                except Exception as error:
+                    self._error = error
+
+            for event in waiting:
+                event.set()
+
+            if stop and self._queue.empty():
+                return
+
+
+_ESCAPE: re.Pattern[bytes] = re.compile(rb"\x1b")
+"""Regex pattern that matches the escape character."""
+
+_SGR: re.Pattern[bytes] = re.compile(rb"\x1b\[([0-9;]*)m")
+"""Regex pattern that matches SGR sequences in bytes."""
+
+_SGR_SEQUENCE: re.Pattern[bytes] = re.compile(rb"\x1b\[[0-9;]*m")
+"""Regex pattern that matches whole SGR sequences in bytes."""
+
+_SEQUENCE: re.Pattern[bytes] = re.compile(
+    # see adorable.measure.ANSI_PATTERN
+    rb"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)"
+    rb"|[PX^_][^\x1b]*\x1b\\|[ -/]*[0-~]"
+    # an escape character that does not start a complete sequence
+    rb"|)"
+)
+"""Regex pattern that matches ansi escape sequences in bytes."""
+
+_PARTIAL: re.Pattern[bytes] = re.compile(
+    rb"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*\x1b?"
+    rb"|[PX^_][^\x1b]*\x1b?|[ -/]*)\Z"
+)
+"""Regex pattern that matches the beginning of an unfinished sequence."""
+
+
+_COLOR_SIZES: dict[bytes, int] = {b"5": 3, b"2": 5}
+"""Number of parameters of ``38;5;n`` and ``38;2;r;g;b`` by their mode."""
+
+_KNOWN_LIMIT: int = 32
+"""Number of different SGR sequences that are removed without a regex."""
+
+
+@lru_cache(maxsize=1024)
+def _rewrite_sgr(params: bytes, terminal: Terminal) -> bytes:
+    """
+    Returns an SGR sequence with the colors of the
+    color system. Other parameters are kept.
+    """
+    from .encoder import _downgrade_color
+
+    values = params.split(b";")
+    result: list[bytes] = []
+    index = 0
+
+    while index < len(values):
+        value = values[index]
+        size = 0
+        if value in (b"38", b"48") and index + 1 < len(values):
+            size = _COLOR_SIZES.get(values[index + 1], 0)
+
+        fields = values[index:index + size]
+        if size and len(fields) == size and all(fields):
+            color = tuple(map(int, fields))
+            if max(color[2:]) <= 255:
+                downgraded = _downgrade_color(color, terminal) or ()
+                result.extend(b"%d" % v for v in downgraded)
+                index += size
+                continue
+
+        result.append(value)
+        index += 1
+
+    return b"\x1b[" + b";".join(result) + b"m"
+
+
+class _Sequences(dict[bytes, bytes]):
+    """
+    Rewritten SGR sequences by their parameters.
+    """
+
+    def __init__(self, terminal: Terminal) -> None:
+        super().__init__()
+        self.terminal = terminal
+
+    def __missing__(self, params: bytes) -> bytes:
+        if len(self) >= 4096:
+            self.clear()
+        self[params] = sequence = _rewrite_sgr(params, self.terminal)
+        return sequence
+
+
+class DowngradingStream(io.RawIOBase):
+    """
+    Binary stream that writes styled bytes to another
+    stream with the colors of a lower color system.
+
+    SGR sequences are rewritten with the closest colors
+    of ``target``. With ``Terminal.NOCOLOR`` all escape
+    sequences are removed, which turns styled output into
+    plain text. Bytes without an escape character are
+    written as they are without being copied. Sequences
+    that are split between two writes are completed by
+    the next write.
+
+    Removing the sequences of styled bytes is a bit
+    faster than removing them from decoded text with
+    :data:`adorable.measure.ANSI_PATTERN`, as long as
+    a stream uses only a few different SGR sequences.
+    Rewriting colors and passing on unstyled bytes is
+    faster.
+
+    Examples
+    --------
+    .. code-block::
+
+       with open("build.log", "wb") as file:
+           stream = DowngradingStream(file, Terminal.NOCOLOR)
+           for chunk in iter(lambda: process.stdout.read(65536), b""):
+               stream.write(chunk)
+           stream.close()
+
+    Parameters
+    ----------
+    raw
+        The binary stream to write to.
+
+    target
+        The color system of ``raw``.
+
+    max_sequence_length
+        Number of bytes of an unfinished sequence that
+        are kept for the next write. Longer unfinished
+        sequences are written as they are.
+    """
+
+    def __init__(
+        self,
+        raw: BinaryIO,
+        target: Terminal = Terminal.BIT8,
+        max_sequence_length: int = 4096,
+    ) -> None:
+        super().__init__()
+        self.raw = raw
+        self.target = target
+        self.max_sequence_length = max_sequence_length
+        self._pending = b""
+        self._sequences = _Sequences(target)
+        self._known: list[bytes] = []
+        self._learning = True
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        """
+        Writes styled bytes.
+
+        Parameters
+        ----------
+        data
+            A bytes-like object.
+
+        Returns
+        -------
+        Number of bytes written, which is always the
+        length of ``data``.
+        """
+        if self.closed:
+            raise ValueError("write to closed stream")
+
+        with memoryview(data) as view:
+            size = view.nbytes
+            if self._pending:
+                view = memoryview(self._pending + view.cast("B"))
+                self._pending = b""
+            else:
+                view = view.cast("B")
+
+            escape = _ESCAPE.search(view)
+            if self.target == Terminal.BIT24 or escape is None:
+                _write_all(self.raw, view)
+                return size
+
+            # an unfinished sequence at the end is kept for the next write
+            start = max(0, len(view) - self.max_sequence_length)
+            partial = _PARTIAL.search(view, start)
+            if partial is not None:
+                self._pending = view[partial.start():].tobytes()
+                view = view[:partial.start()]
+
+            if self.target == Terminal.NOCOLOR:
+                # text before the first escape character is written as it is
+                start = min(escape.start(), len(view))
+                if start:
+                    _write_all(self.raw, view[:start])
+                if start < len(view):
+                    _write_all(self.raw, self._strip(view[start:].tobytes()))
+            else:
+                # text and parameters of SGR sequences alternate
+                parts = _SGR.split(view)
+                parts[1::2] = map(self._sequences.__getitem__, parts[1::2])
+                _write_all(self.raw, b"".join(parts))
+
+        return size
+
+    def _strip(self, data: bytes) -> bytes:
+        """
+        Removes the escape sequences of ``data``.
+
+        If every escape character starts one of the SGR
+        sequences seen before, these are removed with
+        ``bytes.replace``. Otherwise the regex is used
+        and the SGR sequences of ``data`` are remembered.
+        """
+        known = self._known
+        escapes = data.count(b"\x1b")
+        if known and sum(map(data.count, known)) == escapes:
+            for sequence in known:
+                data = data.replace(sequence, b"")
+            return data
+
+        if self._learning:
+            found = set(_SGR_SEQUENCE.findall(data))
+            if len(found) <= _KNOWN_LIMIT:
+                self._known = list(found)
+            else:
+                # too many different colors to remove them one by one
+                self._known = []
+                self._learning = False
+        return b"".join(_SEQUENCE.split(data))
+
+    def flush(self) -> None:
+        """
+        Flushes the stream written to. An unfinished
+        sequence stays in the buffer.
+        """
+        if self.closed:
+            raise ValueError("flush of closed stream")
+        self.raw.flush()
+
+    def close(self) -> None:
+        """
+        Writes an unfinished sequence as it is (or drops
+        it with ``Terminal.NOCOLOR``) and flushes the
+        stream written to. The stream is not closed.
+        """
+        if self.closed:
+            return
+
+        if self._pending and self.target != Terminal.NOCOLOR:
+            _write_all(self.raw, self._pending)
+        self._pending = b""
+        self.raw.flush()
+        super().close()
@@ -0,0 +1,21 @@
+import asyncio
+import os
+
+from adorable import BOLD, paint
+from adorable.aio import AsyncStyledWriter, aprintc
+
+
+def test_pipe():
+    read, write = os.pipe()
+
+    async def main():
+        out = await AsyncStyledWriter.connect(os.fdopen(write, "wb"))
+        await aprintc("a", "b", style=BOLD, file=out)
+        await out.write("ä")
+        out.close()
+        await out.wait_closed()
+
+    asyncio.run(main())
+
+    with os.fdopen(read, "rb") as pipe:
+        assert pipe.read().decode() == paint("a b", style=BOLD) + "\nä"
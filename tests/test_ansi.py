@@ -0,0 +1,26 @@
+from adorable import BOLD, ITALIC, paint, painter
+from adorable.style import Style
+
+
+def test_paint():
+    assert paint("a", 1, style=BOLD) == "\x1b[1ma 1\x1b[22m"
+    assert paint("a", "b", sep="-") == "a-b"
+
+
+def test_escape_sequences_are_cached():
+    style = Style(1, 22)
+    assert style.enable_str() is style.enable_str()
+    assert style.enable_str() is BOLD.enable_str()
+
+    style = style.extend(ITALIC)
+    assert style.enable_str() == "\x1b[1;3m"
+    assert style.disable_str() == "\x1b[22;23m"
+    assert (BOLD + ITALIC).enable_str() is style.enable_str()
+
+
+def test_painter():
+    bold = BOLD.compile()
+    assert bold("a") == paint("a", style=BOLD)
+    assert bold("a", 1) == paint("a", 1, style=BOLD)
+    assert bold() == paint(style=BOLD)
+    assert painter(sep="-")("a", "b") == "a-b"
@@ -1,8 +1,110 @@
+import pytest
+
 import adorable
-from adorable import color
+from adorable import _palette, color, quantize, webcolors
 
 def test_nocolor():
     adorable.use("NOCOLOR")
     RED = color.from_name("red")
     assert RED.fg("Hello") == "\x1b[mHello\x1b[0m"
-    
+
+
+def test_factories_are_cached():
+    color.cache_clear()
+    adorable.use("BIT8")
+    first = color.from_hex(0xFF0000)
+    second = color.from_rgb((255, 0, 0))
+    assert color.cache_info().hits == 1
+    assert first is second
+    assert str(first.fg) == str(second.fg) == "\x1b[38;5;9m"
+
+    adorable.use("BIT24")
+    assert str(color.from_hex("#F00").bg) == "\x1b[48;2;255;0;0m"
+    assert color.cache_info().misses == 2
+
+
+def test_colors_are_immutable():
+    adorable.use("BIT8")
+    red = color.from_name("red")
+    fore = red.fg
+    assert red is not fore
+    assert not red.is_initialized()
+    assert fore == color.from_name("red").fg
+    assert hash(fore) == hash(color.from_name("red").fg)
+    assert fore != red.bg
+
+    combined = fore + adorable.BOLD
+    assert combined is not fore
+    assert str(fore) == "\x1b[38;5;9m"
+    assert str(combined) == "\x1b[38;5;9;1m"
+    assert len({combined, fore + adorable.BOLD}) == 1
+
+
+def test_uninitialized_colors_are_distinct():
+    red = color.Color24bit.from_rgb((255, 0, 0))
+    blue = color.Color24bit.from_rgb((0, 0, 255))
+    assert red != blue
+    assert hash(red) != hash(blue)
+    assert red == color.Color24bit.from_rgb((255, 0, 0))
+
+    low = color.Color8bit.from_rgb((1, 2, 3))
+    other = color.Color3bit.from_rgb((9, 9, 9))
+    assert low != other
+    assert hash(low) != hash(other)
+    assert color.Color0bit() != low
+    assert len({red, blue, low, other}) == 4
+
+
+def test_extend_interned_color():
+    adorable.use("BIT8")
+    color.from_name("red").extend(adorable.BOLD)
+    assert str(color.from_name("red").fg) == "\x1b[38;5;9m"
+
+    red = color.from_name("red").fg
+    extended = red.extend(adorable.BOLD)
+    assert extended is not red
+    assert str(extended) == "\x1b[38;5;9;1m"
+    assert str(red) == str(color.from_name("red").fg) == "\x1b[38;5;9m"
+    assert hash(red) == hash(color.from_name("red").fg)
+
+
+def test_release_mode(monkeypatch):
+    adorable.use("BIT8")
+    red = color.from_name("red")
+    with pytest.raises(color._GroundError):
+        red("x")
+
+    monkeypatch.setattr(color, "validate", True)
+    adorable.configure(validate=False)
+    assert color.validate is False
+    assert red("x") == "\x1b[mx\x1b[0m"
+    assert red.fg("x") == "\x1b[38;5;9mx\x1b[0m"
+    with pytest.raises(color._GroundError):
+        red.fg.fg
+
+
+def test_from_name_uses_precomputed_indices(monkeypatch):
+    adorable.use("BIT8")
+    monkeypatch.setattr(quantize, "quantize_8bit", None)
+    monkeypatch.setattr(quantize, "quantize_3bit", None)
+    assert str(color.from_name("Red").fg) == "\x1b[38;5;9m"
+    assert color.Color3bit.from_name("white")._data["ansi"] == 7
+
+    for i, name in enumerate(webcolors.NAMES):
+        rgb = webcolors.COLORS[name]
+        assert webcolors.index(name) == i
+        assert webcolors.INDEX8[i] == quantize._nearest(rgb, _palette.ANSI8BIT)
+        assert webcolors.INDEX3[i] == quantize._nearest(rgb, _palette.ANSI3BIT)
+
+    with pytest.raises(KeyError):
+        color.from_name("notacolor")
+
+
+@pytest.mark.parametrize("mode", ["exact", "table", "cube"])
+def test_from_name_agrees_with_from_hex(monkeypatch, mode):
+    monkeypatch.setattr(quantize, "mode", mode)
+    for colortype in (color.Color3bit, color.Color8bit):
+        for name in webcolors.NAMES:
+            by_name = colortype.from_name(name)
+            by_hex = colortype.from_rgb(webcolors.COLORS[name])
+            assert by_name._data["ansi"] == by_hex._data["ansi"]
@@ -0,0 +1,67 @@
+from adorable import BOLD, AnsiDecoder, Color3bit, Color8bit, Color24bit, Text
+from adorable import decoder as decoder_module
+from adorable.term import Terminal
+
+
+STYLED = (
+    "a\x1b[1;38;2;255;0;0mred\x1b[22m \x1b[0m"
+    "\x1b]0;title\x07\x1b[91;44mb\x1b[m"
+)
+
+
+def test_decode():
+    text = Text.from_ansi(STYLED)
+    assert text.plain == "ared b"
+
+    red = Color24bit.from_rgb((255, 0, 0)).fg
+    assert text.spans == [
+        (1, 4, BOLD + red),
+        (4, 5, red),
+        (
+            5,
+            6,
+            Color8bit(ansi=9, rgb=(255, 0, 0)).fg
+            + Color3bit(ansi=4, rgb=None).bg,
+        ),
+    ]
+    assert Text.from_ansi(text.render()) == text
+    assert Text.from_ansi("plain") == Text("plain")
+
+
+def test_decode_continues_style():
+    decoder = AnsiDecoder(Terminal.BIT24)
+    assert decoder.decode("\x1b[1ma") == Text("a", BOLD)
+    assert decoder.decode("b\x1b[0mc") == Text("b", BOLD) + "c"
+
+
+def test_recode():
+    decoder = AnsiDecoder(Terminal.BIT8)
+    assert decoder.recode(STYLED) == "a\x1b[1;38;5;9mred\x1b[22m \x1b[44mb"
+    assert decoder.recode("c") + decoder.close() == "\x1b[0mc"
+
+    decoder = AnsiDecoder(Terminal.NOCOLOR)
+    assert decoder.recode(STYLED) + decoder.close() == "a\x1b[1mred\x1b[0m b"
+
+
+def test_colors_are_quantized_once(monkeypatch):
+    calls = []
+    downgrade = decoder_module._downgrade_color
+
+    def counting(color, terminal):
+        calls.append(color)
+        return downgrade(color, terminal)
+
+    monkeypatch.setattr(decoder_module, "_downgrade_color", counting)
+    decoder = AnsiDecoder(Terminal.BIT3)
+    for _ in range(3):
+        decoder.recode("\x1b[38;2;1;2;3ma\x1b[48;2;1;2;3mb\x1b[0m")
+    assert calls == [(38, 2, 1, 2, 3), (48, 2, 1, 2, 3)]
+
+
+def test_color_cache_is_limited(monkeypatch):
+    monkeypatch.setattr(decoder_module, "_COLORS_LIMIT", 4)
+    decoder = AnsiDecoder(Terminal.BIT8)
+    for blue in range(10):
+        decoder.recode("\x1b[38;2;0;0;%dmx" % blue)
+        assert (38, 2, 0, 0, blue) in decoder._colors
+        assert len(decoder._colors) <= 4
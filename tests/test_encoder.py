@@ -0,0 +1,53 @@
+import io
+
+import adorable
+from adorable import BOLD, DIM, ITALIC, color, paint
+from adorable.encoder import Encoder, SGRState
+
+
+def test_state():
+    state = SGRState().apply([1, 2, 38, 5, 9, "48", "2", 1, 2, 3])
+    assert state == SGRState((38, 5, 9), (48, 2, 1, 2, 3), frozenset({1, 2}))
+    background = (48, 2, 1, 2, 3)
+    assert state.apply([22, 39]) == SGRState(None, background, frozenset())
+    assert state.apply([0]) == SGRState()
+
+
+def test_transition():
+    bold_dim = SGRState(attributes=frozenset({1, 2}))
+    dim = SGRState(attributes=frozenset({2}))
+    assert bold_dim.transition(dim) == "\x1b[0;2m"
+    assert dim.transition(bold_dim) == "\x1b[1m"
+    assert bold_dim.transition(SGRState()) == "\x1b[0m"
+    assert dim.transition(dim) == ""
+
+
+def test_paint_with_encoder():
+    encoder = Encoder()
+    text = paint("a", style=BOLD, encoder=encoder)
+    text += paint("b", style=BOLD, encoder=encoder)
+    text += paint("c", style=BOLD + ITALIC, encoder=encoder)
+    text += paint("d", encoder=encoder)
+    text += encoder.close()
+    assert text == "\x1b[1mab\x1b[3mc\x1b[0md"
+
+
+def test_markup_with_encoder():
+    adorable.use("BIT8")
+    style = {"b": BOLD, "d": DIM, "red": color.from_name("red").fg}
+    encoder = Encoder()
+    text = adorable.markup_xml(
+        "x<red>a<b>b</b><b>c</b>d</red>", style=style, encoder=encoder
+    )
+    text += encoder.close()
+    assert text == "x\x1b[38;5;9ma\x1b[1mbc\x1b[22md\x1b[0m"
+
+
+def test_using():
+    encoder = Encoder()
+    file = io.StringIO()
+    with encoder.using(BOLD, file):
+        with encoder.using(ITALIC, file):
+            file.write("x")
+        file.write("y")
+    assert file.getvalue() == "\x1b[1m\x1b[3mx\x1b[23my\x1b[0m"
@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import adorable
+
+
+IMPORT_BUDGET_US = 20_000
+"""Maximum time spent in adorable's own modules on import."""
+
+
+def run(code, *options):
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, adorable\n"
+        "adorable.paint('x', style=adorable.BOLD)\n"
+        "print(*sorted(sys.modules))"
+    )
+    modules = set(run(code).stdout.split())
+    assert "adorable.ansi" in modules
+    for name in [
+        "adorable.color",
+        "adorable.markup",
+        "adorable.stylesheet",
+        "adorable._palette",
+        "adorable.webcolors",
+        "xml.etree.ElementTree",
+        "html",
+    ]:
+        assert name not in modules
+
+
+def test_import_time():
+    stderr = run("import adorable", "-X", "importtime").stderr
+    total = 0
+    for line in stderr.splitlines():
+        parts = line.replace(":", "|", 1).split("|")
+        _, self_us, _, name = (part.strip() for part in parts)
+        if name.split(".")[0] == "adorable":
+            total += int(self_us)
+    assert 0 < total < IMPORT_BUDGET_US
+
+
+def test_star_import():
+    code = (
+        "from adorable import *\n"
+        "print(*sorted(name for name in dir() if not name.startswith('_')))"
+    )
+    names = set(run(code).stdout.split())
+    assert names == set(adorable.__all__)
+    for name in [
+        "Color3bit",
+        "Color8bit",
+        "Color24bit",
+        "markup_xml",
+        "insert",
+        "export",
+        "load_stylesheet",
+        "remove_style",
+        "remove_all",
+        "ANSI_REGEX",
+        "paint",
+        "BOLD",
+    ]:
+        assert name in names
+    for name in ["Any", "TextIO", "re", "sys", "import_module"]:
+        assert name not in names
+
+
+def test_lazy_attributes():
+    assert adorable.Color8bit is adorable.color.Color8bit
+    assert adorable.markup_xml is adorable.markup.markup_xml
+    assert adorable._globals is adorable.stylesheet._globals
+    styled = adorable.paint("a", style=adorable.BOLD)
+    assert adorable.ANSI_REGEX.sub("", styled) == "a"
+    assert "StyledWriter" in dir(adorable)
+    with pytest.raises(AttributeError):
+        adorable.missing
@@ -0,0 +1,160 @@
+import random
+
+import pytest
+
+import adorable
+from adorable import BOLD, DIM, color, markup_brackets, stylesheet
+from adorable.encoder import Encoder
+
+
+def test_markup_brackets():
+    adorable.use("BIT8")
+    red = color.from_name("red").fg
+    style = {"red": red, "bold": BOLD}
+
+    assert markup_brackets("a[0] [ b]", style) == "a[0] [ b]"
+    assert markup_brackets("[red]a[/red] b", style) == "\x1b[38;5;9ma\x1b[0m b"
+    # closing a nested tag enables all outer tags again
+    assert markup_brackets("[red][bold]a[/]b[/]", style) == (
+        "\x1b[38;5;9m\x1b[1ma\x1b[22m\x1b[38;5;9mb\x1b[0m"
+    )
+    # open tags are closed at the end
+    assert markup_brackets("[bold]a", style) == "\x1b[1ma\x1b[22m"
+    escaped = adorable.escape_markup("[bold]a")
+    assert markup_brackets(escaped, style) == "[bold]a"
+    assert markup_brackets("[[[bold]a[/]", style) == "[\x1b[1ma\x1b[22m"
+
+
+def test_markup_brackets_errors():
+    with pytest.raises(ValueError):
+        markup_brackets("[missing]a")
+
+    with pytest.raises(ValueError):
+        markup_brackets("[bold]a[/dim]", {"bold": BOLD, "dim": DIM})
+
+    with pytest.raises(ValueError):
+        markup_brackets("a[/]")
+
+
+def test_markup_brackets_encoder():
+    encoder = Encoder()
+    style = {"bold": BOLD, "dim": DIM}
+    text = markup_brackets("[bold]a[dim]b[/dim][/bold]c[[", style, encoder)
+    assert text + encoder.close() == "\x1b[1ma\x1b[2mb\x1b[0mc["
+
+
+def test_exported_styles():
+    adorable.export(bold=DIM)
+    try:
+        assert markup_brackets("[bold]a[/]") == "\x1b[2ma\x1b[22m"
+        styled = markup_brackets("[bold]a[/]", {"bold": BOLD})
+        assert styled == "\x1b[1ma\x1b[22m"
+    finally:
+        adorable.remove_all()
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_compile_markup():
+    adorable.use("BIT8")
+    style = {"red": color.from_name("red").fg, "bold": BOLD}
+    cases = [
+        ("<red>{}</red> {:>6} &amp; {{literal}}", ("<b>", "a&b"), {}),
+        ("<red>{}</red> {:>6} &amp; {{literal}}", ("&lt;", "x"), {}),
+        ("<bold>{name!e}</bold> <red>{name}</red>", (), {"name": "&amp;"}),
+        ("<bold>{0[0]}</bold> {1[1]}", (["a"], ["x", "&y"]), {}),
+        # fields that may contain markup are formatted on every render
+        ("<bold>{!r}</bold> {}", ("<red>a</red>", "b"), {}),
+    ]
+
+    for template, args, kwargs in cases:
+        compiled = adorable.compile_markup(template, style)
+        assert (compiled._segments is None) == ("!r" in template)
+        assert compiled.render(*args, **kwargs) == adorable.markup_xml(
+            template, dict(style), (args, kwargs)
+        )
+
+    with pytest.raises(ValueError):
+        adorable.compile_markup("{!x}")
+
+    with pytest.raises(ValueError):
+        adorable.compile_markup("{} {0}")
+
+
+def test_markup_parser_chunks():
+    rng = random.Random(0)
+    style = {"bold": BOLD, "dim": DIM}
+    tokens = [
+        "[bold]", "[dim]", "[/dim]", "[/]", "[[", "[", "]", "1", "2 ", "[0]"
+    ]
+
+    for _ in range(300):
+        markup = "".join(rng.choices(tokens, k=20))
+        try:
+            expected = markup_brackets(markup, style)
+        except ValueError:
+            continue
+
+        cuts = sorted(rng.sample(range(len(markup) + 1), 3))
+        bounds = zip([0, *cuts], [*cuts, len(markup)])
+        chunks = [markup[i:j] for i, j in bounds]
+
+        parser = adorable.MarkupParser(style)
+        text = "".join(map(parser.feed, chunks)) + parser.close()
+        assert text == expected
+
+        encoder = Encoder()
+        parser = adorable.MarkupParser(style, encoder)
+        text = "".join(map(parser.feed, chunks)) + parser.close()
+        text += encoder.close()
+        expected_encoder = Encoder()
+        expected = markup_brackets(markup, style, expected_encoder)
+        assert text == expected + expected_encoder.close()
+
+
+def test_markup_parser_is_bounded():
+    parser = adorable.MarkupParser({"bold": BOLD}, max_tag_length=8)
+    assert parser.feed("a[bo") == "a"
+    assert parser.feed("ld]b") == "\x1b[1mb"
+    assert parser.feed("[" + "x" * 20) == "[" + "x" * 20
+    assert parser.close() == "\x1b[22m"
+
+    parser = adorable.MarkupParser({"bold": BOLD}, max_depth=2)
+    parser.feed("[bold][bold]a")
+    with pytest.raises(ValueError):
+        parser.feed("[bold]")
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_markup_xml_resets_after_elements():
+    # the same bytes as before the escape sequences were cached
+    style = {"b": BOLD, "d": DIM}
+    assert adorable.markup_xml("x<b>a<d>b</d></b>y", style) == (
+        "x\x1b[1ma\x1b[2mb\x1b[22m\x1b[1m\x1b[22m\x1b[my"
+    )
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_loaded_styles():
+    version = stylesheet._version
+    style = {"bold": BOLD}
+    adorable.export(em=DIM, bold=DIM)
+    try:
+        template = adorable.compile_markup("<em>a</em>", style)
+        assert stylesheet._version > version
+        assert stylesheet.get_sequences("em") == ("\x1b[2m", "\x1b[22m")
+        # local styles take precedence and are not modified
+        assert adorable.markup_xml("<bold>a</bold><em>b</em>", style) == (
+            "\x1b[1ma\x1b[22m\x1b[m\x1b[2mb\x1b[22m\x1b[m"
+        )
+        assert style == {"bold": BOLD}
+        assert template.render() == "\x1b[2ma\x1b[22m\x1b[m"
+
+        adorable.export(em=BOLD)
+        assert template.render() == "\x1b[1ma\x1b[22m\x1b[m"
+    finally:
+        adorable.remove_all()
+
+    with pytest.raises(KeyError):
+        stylesheet.get_sequences("em")
+    with pytest.raises(ValueError):
+        template.render()
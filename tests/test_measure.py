@@ -0,0 +1,24 @@
+import adorable
+from adorable import BOLD
+from adorable.measure import strip_ansi, visible_width
+
+
+def test_strip_ansi():
+    text = "plain text"
+    assert strip_ansi(text) is text
+
+    styled = (
+        "\x1b[?25l\x1b[38;5;9mred\x1b[0m "
+        "\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x1b\\ "
+        "\x1b]0;title\x07\x1b7\x1b(Bend"
+    )
+    assert strip_ansi(styled) == "red link end"
+    assert strip_ansi(adorable.paint("a", style=BOLD)) == "a"
+
+
+def test_visible_width():
+    assert visible_width("abc") == 3
+    assert visible_width(adorable.paint("abc", style=BOLD)) == 3
+    assert visible_width("\u65e5\u672c") == 4
+    assert visible_width("e\u0301") == 1
+    assert visible_width("a\u200bb\n") == 2
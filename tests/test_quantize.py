@@ -0,0 +1,172 @@
+import random
+
+import pytest
+
+from adorable import _palette, quantize
+from adorable.color import Color3bit, Color8bit, Terminal, render_many
+from adorable.quantize import (
+    ANSI3BIT_TABLE,
+    ANSI8BIT_TABLE,
+    LookupTable,
+    closest_8bit,
+)
+from adorable.utils import RGB, _get_closest_color
+
+
+def _distance(a, b):
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+def test_palette_colors_are_exact():
+    for table, palette in [
+        (ANSI3BIT_TABLE, _palette.ANSI3BIT),
+        (ANSI8BIT_TABLE, _palette.ANSI8BIT),
+    ]:
+        for rgb in palette:
+            assert table(rgb) == _get_closest_color(rgb, enumerate(palette))
+
+
+def test_lookup_table_is_close():
+    palette = [(0, 0, 0), (255, 255, 255), (255, 0, 0)]
+    table = LookupTable(palette)
+    assert table((10, 12, 9)) == 0
+    assert table((250, 240, 251)) == 1
+    assert table((200, 30, 20)) == 2
+    assert table((300, -5, 0)) == 2
+
+
+def test_lookup_table_error_is_bounded():
+    for rgb in [(3, 77, 140), (201, 13, 99), (64, 64, 65), (250, 128, 7)]:
+        best = _get_closest_color(RGB(*rgb), enumerate(_palette.ANSI8BIT))
+        found = ANSI8BIT_TABLE(rgb)
+        # a cell is 8 units wide, so the error is at most its diagonal
+        assert _distance(rgb, _palette.ANSI8BIT[found]) ** 0.5 <= (
+            _distance(rgb, _palette.ANSI8BIT[best]) ** 0.5 + 2 * 3**0.5 * 4
+        )
+
+
+def test_closest_8bit_agrees_with_brute_force():
+    rng = random.Random(0)
+    colors = list(_palette.ANSI8BIT)
+    colors += [
+        tuple(rng.randrange(256) for _ in range(3)) for _ in range(3000)
+    ]
+    colors += [(v, v, v) for v in range(256)]
+
+    for rgb in colors:
+        best = _get_closest_color(RGB(*rgb), enumerate(_palette.ANSI8BIT))
+        found = closest_8bit(rgb)
+        assert _distance(rgb, _palette.ANSI8BIT[found]) == _distance(
+            rgb, _palette.ANSI8BIT[best]
+        )
+        if rgb in _palette.ANSI8BIT:
+            assert found == best
+
+
+@pytest.mark.parametrize("mode", ["exact", "table", "cube"])
+def test_mode(monkeypatch, mode):
+    monkeypatch.setattr(quantize, "mode", mode)
+    assert Color8bit.from_rgb((255, 0, 0))._data["ansi"] == 9
+    assert Color8bit.from_rgb((0, 0, 94))._data["ansi"] == 17
+
+
+def test_default_mode_is_exact():
+    rng = random.Random(2)
+    colors = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(2000)]
+
+    assert quantize.mode == "exact"
+    for rgb in colors:
+        best_8bit = quantize._nearest(rgb, _palette.ANSI8BIT)
+        best_3bit = quantize._nearest(rgb, _palette.ANSI3BIT)
+        assert quantize.quantize_8bit(rgb) == best_8bit
+        assert quantize.quantize_3bit(rgb) == best_3bit
+
+
+def test_unknown_mode(monkeypatch):
+    monkeypatch.setattr(quantize, "mode", "fast")
+    with pytest.raises(ValueError):
+        Color8bit.from_rgb((1, 2, 3))
+
+
+def test_nearest_many_python():
+    colors = [(255, 0, 0), (0, 0, 94), (255, 0, 0), (3, 3, 3)]
+    indices = quantize._nearest_many_python(colors, _palette.ANSI8BIT)
+    assert indices == [9, 17, 9, 0]
+    assert quantize._nearest_many_python(colors, _palette.ANSI3BIT) == [
+        quantize._nearest(rgb, _palette.ANSI3BIT) for rgb in colors
+    ]
+
+
+def test_nearest_many_numpy():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    colors = rng.integers(0, 256, size=(5000, 3), dtype=np.uint8)
+    indices = quantize.nearest_many(colors, _palette.ANSI8BIT)
+    assert indices.dtype == np.uint8
+    for rgb, found in zip(colors.tolist(), indices.tolist()):
+        assert _distance(rgb, _palette.ANSI8BIT[found]) == _distance(
+            rgb, _palette.ANSI8BIT[closest_8bit(rgb)]
+        )
+
+
+def test_nearest_many_numpy_large_palette_and_generator():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(4)
+    colors = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(300)]
+
+    indices = quantize.nearest_many(colors, colors)
+    assert indices.tolist() == list(range(300))
+
+    generated = quantize.nearest_many(
+        (rgb for rgb in colors[:20]), _palette.ANSI8BIT
+    )
+    assert generated.dtype == np.uint8
+    assert generated.tolist() == [closest_8bit(rgb) for rgb in colors[:20]]
+
+
+def test_render_many():
+    colors = [(255, 0, 0), (0, 0, 94)]
+    assert render_many(colors, Terminal.BIT8) == [
+        "\x1b[38;5;9m",
+        "\x1b[38;5;17m",
+    ]
+    assert render_many(colors, Terminal.BIT24, background=True) == [
+        "\x1b[48;2;255;0;0m",
+        "\x1b[48;2;0;0;94m",
+    ]
+
+
+@pytest.mark.parametrize("mode", ["exact", "table", "cube"])
+@pytest.mark.parametrize("colortype", [Color3bit, Color8bit])
+def test_render_many_agrees_with_from_rgb(monkeypatch, mode, colortype):
+    monkeypatch.setattr(quantize, "mode", mode)
+    terminal = Terminal.BIT3 if colortype is Color3bit else Terminal.BIT8
+    rng = random.Random(3)
+    colors = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(500)]
+
+    expected = [colortype.from_rgb(rgb).fg.enable_str() for rgb in colors]
+    assert render_many(colors, terminal) == expected
+
+
+def test_palette_agrees_with_brute_force():
+    rng = random.Random(1)
+    colors = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(300)]
+    palette = quantize.Palette(colors + colors[:10])
+
+    for rgb in colors[:50]:
+        assert palette.closest(rgb) == colors.index(rgb)
+
+    for _ in range(1000):
+        rgb = tuple(rng.randrange(256) for _ in range(3))
+        best = quantize._nearest(rgb, colors)
+        assert palette.closest(rgb) == best
+
+
+def test_color_from_palette():
+    palette = quantize.Palette([(40, 42, 54), (255, 85, 85), (80, 250, 123)])
+    assert Color8bit.from_name("red", palette=palette)._data["ansi"] == 1
+    assert Color3bit.from_hex(0x00FF00, palette=palette)._data["ansi"] == 2
+
+    with pytest.raises(ValueError):
+        too_large = quantize.Palette(_palette.ANSI8BIT)
+        Color3bit.from_rgb((0, 0, 0), palette=too_large)
@@ -0,0 +1,69 @@
+import io
+import os
+import pty
+import threading
+
+import adorable
+from adorable import color, term
+from adorable.term import Terminal
+
+
+def test_for_stream(monkeypatch):
+    monkeypatch.setattr(term, "override", None)
+    monkeypatch.setenv("ADORABLE_COLOR", "8bit")
+    Terminal.clear_streams()
+
+    main, sub = pty.openpty()
+    read, write = os.pipe()
+    try:
+        with open(sub, "w", closefd=False) as tty, open(
+            write, "w", closefd=False
+        ) as pipe:
+            assert Terminal.for_stream(tty) == Terminal.BIT8
+            assert Terminal.for_stream(pipe) == Terminal.NOCOLOR
+            assert Terminal.for_stream(io.StringIO()) == Terminal.NOCOLOR
+
+            # cached per file descriptor
+            monkeypatch.setenv("ADORABLE_COLOR", "24bit")
+            assert Terminal.for_stream(tty) == Terminal.BIT8
+
+            assert color.get_color(tty) is color.Color8bit
+            red = color.from_name("red", stream=pipe)
+            assert type(red) is color.Color0bit
+            assert Terminal.BIT8.is_supported(tty)
+            assert not Terminal.BIT3.is_supported(pipe)
+    finally:
+        Terminal.clear_streams()
+        for fd in [main, sub, read, write]:
+            os.close(fd)
+
+
+def test_for_stream_threads(monkeypatch):
+    monkeypatch.setattr(term, "override", None)
+    Terminal.clear_streams()
+    read, write = os.pipe()
+    results = []
+    try:
+        with open(write, "w", closefd=False) as pipe:
+            def detect():
+                results.append(Terminal.for_stream(pipe))
+
+            threads = [threading.Thread(target=detect) for _ in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    finally:
+        Terminal.clear_streams()
+        os.close(read)
+        os.close(write)
+
+    assert results == [Terminal.NOCOLOR] * 16
+
+
+def test_override(monkeypatch):
+    # adorable.use sets both, the originals are restored afterwards
+    monkeypatch.setattr(term, "override", None)
+    monkeypatch.setattr(term, "cache", None)
+    adorable.use("BIT3")
+    assert Terminal.for_stream(io.StringIO()) == Terminal.BIT3
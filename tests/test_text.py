@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from adorable import BOLD, ITALIC, Color3bit, Color8bit, Color24bit, Text
+from adorable.encoder import Encoder
+from adorable.term import Terminal
+from adorable.text import SpanIndex
+
+
+RED = Color24bit.from_rgb((255, 0, 0)).fg
+
+
+def test_render():
+    text = Text("ab", BOLD) + "c"
+    assert text.plain == "abc"
+    assert text.render() == "\x1b[1mab\x1b[0mc"
+    assert str(Text("plain")) == "plain"
+
+    overlap = Text("abc", BOLD).stylize(ITALIC, 1, 2)
+    assert overlap.render() == "\x1b[1ma\x1b[3mb\x1b[23mc\x1b[0m"
+
+    encoder = Encoder()
+    assert Text("a", BOLD).render(encoder=encoder) == "\x1b[1ma"
+    assert Text("b", BOLD).render(encoder=encoder) == "b"
+
+
+def test_render_terminal():
+    text = Text("x", RED)
+    assert text.render(Terminal.BIT24) == "\x1b[38;2;255;0;0mx\x1b[0m"
+    assert text.render(Terminal.BIT8) == "\x1b[38;5;9mx\x1b[0m"
+    assert text.render(Terminal.BIT3) == "\x1b[31mx\x1b[0m"
+    assert text.render(Terminal.NOCOLOR) == "x"
+
+    blue = (0, 0, 255)
+    text = Text("x", Color8bit.from_rgb(blue).bg)
+    expected = Text("x", Color3bit.from_rgb(blue).bg).render()
+    assert text.render(Terminal.BIT3) == expected
+
+
+def test_slice():
+    text = Text("abc", BOLD) + Text("def", ITALIC)
+    assert text[2:4] == Text("c", BOLD) + Text("d", ITALIC)
+    assert text[-1] == Text("f", ITALIC)
+    assert text[3:].spans == [(0, 3, ITALIC)]
+    assert text[4:2].plain == ""
+    with pytest.raises(ValueError):
+        text[::2]
+    with pytest.raises(IndexError):
+        text[6]
+
+
+def test_pad_truncate():
+    text = Text("ab", BOLD)
+    assert text.pad(4).plain == "ab  "
+    assert text.pad(5, "center").plain == " ab  "
+    assert text.pad(3, "right", ".") == "." + text
+    assert text.pad(1) is text
+
+    wide = Text("日本語", BOLD)
+    assert wide.truncate(6) is wide
+    assert wide.truncate(5).plain == "日本"
+    assert wide.truncate(5, "…") == wide[:2] + "…"
+    assert wide.truncate(0, "..").plain == ""
+
+
+def test_styles_per_text():
+    text = Text("ab", BOLD) + Text("c", ITALIC) + Text("d", BOLD)
+    assert len(text._styles) == 2
+    assert text == Text("ab", BOLD) + (Text("c", ITALIC) + Text("d", BOLD))
+    assert text.render() == "\x1b[1mab\x1b[0;3mc\x1b[0;1md\x1b[0m"
+    assert Text("x", BOLD).stylize(BOLD)._styles == Text("x", BOLD)._styles
+
+
+def test_join():
+    parts = [Text("a", BOLD), "b", Text("c", ITALIC)]
+    joined = Text(", ").join(parts)
+    assert joined == Text("a", BOLD) + ", b, " + Text("c", ITALIC)
+    assert Text("-").join([]) == Text()
+
+
+def test_span_index():
+    rng = random.Random(0)
+    starts = [rng.randrange(1000) for _ in range(500)]
+    ends = [start + rng.randrange(1, 200) for start in starts]
+    index = SpanIndex(starts, ends)
+
+    for _ in range(200):
+        start = rng.randrange(1100)
+        stop = start + rng.randrange(1, 50)
+        expected = [
+            i
+            for i in range(len(starts))
+            if starts[i] < stop and ends[i] > start
+        ]
+        assert index.overlapping(start, stop) == expected
+
+
+def test_slice_large_text():
+    styles = [BOLD, ITALIC, RED]
+    text = Text("".join(map(str, range(1000))))
+    for i in range(300):
+        text = text.stylize(styles[i % 3], i * 7, i * 7 + i % 40 + 1)
+
+    window = text[500:560]
+    expected = Text(text.plain[500:560])
+    for start, end, style in text.spans:
+        if start < 560 and end > 500:
+            expected = expected.stylize(
+                style, max(start, 500) - 500, min(end, 560) - 500
+            )
+    assert window == expected
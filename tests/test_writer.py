@@ -0,0 +1,191 @@
+import io
+import threading
+
+import pytest
+
+from adorable import BOLD, paint, printc
+from adorable.term import Terminal
+from adorable.writer import BackgroundWriter, DowngradingStream, StyledWriter
+
+
+class Recorder(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+def test_text_stream():
+    stream = Recorder()
+    with StyledWriter(stream, buffer_size=1024) as out:
+        out.write("a", BOLD)
+        out.printc("b", "c", style=BOLD, sep="-")
+        printc("d", style=BOLD, file=out)
+        assert stream.writes == 0
+
+    assert stream.writes == 1
+    assert stream.getvalue() == (
+        paint("a", style=BOLD) + paint("b-c", style=BOLD) + "\n"
+        + paint("d", style=BOLD) + "\n"
+    )
+
+
+def test_binary_stream():
+    stream = io.BytesIO()
+    out = StyledWriter(stream, buffer_size=64)
+    out.write("äb", BOLD)
+    assert stream.getvalue() == b""
+    out.write("x" * 100)
+    assert stream.getvalue() == (paint("äb", style=BOLD) + "x" * 100).encode()
+
+
+def test_binary_stream_partial_writes():
+    class Partial(io.RawIOBase):
+        def __init__(self, limit):
+            self.data = b""
+            self.limit = limit
+
+        def write(self, b):
+            self.data += bytes(b[:self.limit])
+            return min(len(b), self.limit)
+
+    stream = Partial(3)
+    StyledWriter(stream, buffer_size=4).write("abcdefgh")
+    assert stream.data == b"abcdefgh"
+
+    with pytest.raises(OSError):
+        StyledWriter(Partial(0), buffer_size=4).write("abcdefgh")
+
+
+def test_flush_interval():
+    stream = Recorder()
+    out = StyledWriter(stream, flush_interval=0)
+    out.write("a")
+    assert stream.getvalue() == "a"
+
+
+def test_background_writer():
+    stream = Recorder()
+    records = {
+        paint(f"{n}-{i}", style=BOLD) + "\n"
+        for n in range(8)
+        for i in range(200)
+    }
+
+    with BackgroundWriter(stream) as out:
+        def work(n):
+            for i in range(200):
+                out.printc(f"{n}-{i}", style=BOLD)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        out.flush()
+        assert stream.writes < len(records)
+
+    lines = stream.getvalue().splitlines(keepends=True)
+    assert set(lines) == records
+    assert len(lines) == len(records)
+
+
+STYLED = (
+    b"a\x1b[1;38;2;255;0;0mred\x1b[0m \x1b]0;title\x07"
+    b"\x1b[48;5;196;4mb\x1b[m\x1b[38;5;;1mc\x1b(B"
+)
+
+
+def downgrade(data, target, chunk_size):
+    raw = io.BytesIO()
+    stream = DowngradingStream(raw, target)
+    for start in range(0, len(data), chunk_size):
+        assert stream.write(data[start:start + chunk_size]) == min(
+            chunk_size, len(data) - start
+        )
+    stream.close()
+    return raw.getvalue()
+
+
+def test_downgrading_stream():
+    expected = {
+        Terminal.NOCOLOR: b"ared bc",
+        Terminal.BIT3: STYLED.replace(b"38;2;255;0;0", b"31").replace(
+            b"48;5;196", b"41"
+        ),
+        Terminal.BIT8: STYLED.replace(b"38;2;255;0;0", b"38;5;9"),
+        Terminal.BIT24: STYLED,
+    }
+    for target, output in expected.items():
+        for chunk_size in (1, 2, 7, len(STYLED)):
+            assert downgrade(STYLED, target, chunk_size) == output
+
+
+def test_downgrading_stream_passes_plain_bytes():
+    class Raw(io.BytesIO):
+        def write(self, data):
+            self.last = data
+            return super().write(data)
+
+    raw = Raw()
+    stream = DowngradingStream(raw, Terminal.NOCOLOR)
+    data = bytearray(b"plain text")
+    stream.write(data)
+    assert raw.last.obj is data
+
+    # an unfinished sequence is kept until it is complete
+    stream.write(b"x\x1b[3")
+    assert raw.getvalue() == b"plain textx"
+    stream.write(b"1my")
+    assert raw.getvalue() == b"plain textxy"
+
+
+def test_downgrading_stream_removes_known_sequences():
+    lines = [b"\x1b[2mt\x1b[0m \x1b[1mline %d\x1b[0m\n" % i for i in range(3)]
+    # the second write removes the sequences of the first without the regex
+    data = b"".join(lines) + b"\x1b]0;title\x07\x1b[1;4mz\x1b[0m\x1b["
+    expected = b"t line 0\nt line 1\nt line 2\nz"
+    for chunk_size in (1, 5, len(lines[0]), len(data)):
+        assert downgrade(data, Terminal.NOCOLOR, chunk_size) == expected
+
+
+def test_downgrading_stream_would_block():
+    class NonBlocking(io.RawIOBase):
+        def writable(self):
+            return True
+
+        def write(self, b):
+            return None
+
+    stream = DowngradingStream(NonBlocking(), Terminal.NOCOLOR)
+    with pytest.raises(BlockingIOError):
+        stream.write(b"\x1b[1mbold")
+
+
+def test_downgrading_stream_flush_after_close():
+    stream = DowngradingStream(io.BytesIO())
+    stream.close()
+    stream.close()
+    with pytest.raises(ValueError):
+        stream.flush()
+
+
+def test_background_writer_close_while_flushing():
+    stream = Recorder()
+    out = BackgroundWriter(stream)
+    out.write("a")
+
+    flusher = threading.Thread(target=out.flush)
+    flusher.start()
+    out.close()
+    flusher.join(timeout=5)
+    assert not flusher.is_alive()
+    assert stream.getvalue() == "a"
+
+    out.flush()
+    with pytest.raises(ValueError):
+        out.write("b")